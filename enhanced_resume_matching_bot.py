@@ -11,47 +11,60 @@ import time
 import random
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pickle
 import hashlib
 import sqlite3
 import re
+import importlib.util
 from datetime import datetime, timedelta
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple, Set
 import traceback
 
+def _module_available(*names):
+    """Check that modules are installed without paying their import cost"""
+    return all(importlib.util.find_spec(name) is not None for name in names)
+
+# Heavy optional modules (PyPDF2/docx, NLTK, Selenium) are only probed here and
+# imported inside the methods that use them, so API-only runs never load them
+
 # Enhanced imports for resume analysis
+PDF_AVAILABLE = _module_available('PyPDF2', 'docx')
+if not PDF_AVAILABLE:
+    print("WARNING: PDF/DOCX processing not available")
+
+# Native PDFium text extraction, preferred over pure-Python PyPDF2 when installed
 try:
-    import PyPDF2
-    import docx
-    from docx import Document
-    PDF_AVAILABLE = True
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
 except ImportError:
-    PDF_AVAILABLE = False
-    print("WARNING: PDF/DOCX processing not available")
+    PDFIUM_AVAILABLE = False
 
 # NLP and matching libraries
+NLP_AVAILABLE = _module_available('nltk')
+if not NLP_AVAILABLE:
+    print("WARNING: NLTK not available - using basic matching")
+
 try:
-    import nltk
-    from nltk.corpus import stopwords
-    from nltk.tokenize import word_tokenize
-    from nltk.stem import WordNetLemmatizer
-    NLP_AVAILABLE = True
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    NLP_AVAILABLE = False
-    print("WARNING: NLTK not available - using basic matching")
+    AHOCORASICK_AVAILABLE = False
 
 try:
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
-    import numpy as np
-    SKLEARN_AVAILABLE = True
+    import regex
+    REGEX_AVAILABLE = True
 except ImportError:
-    SKLEARN_AVAILABLE = False
-    print("WARNING: scikit-learn not available - using basic matching")
+    REGEX_AVAILABLE = False
 
 # Optional imports with fallbacks
 try:
@@ -59,6 +72,26 @@ try:
 except ImportError:
     schedule = None
 
+# HTTP/2 client with connection pooling; falls back to requests.Session
+try:
+    import httpx
+    HTTPX_AVAILABLE = _module_available('h2')
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Fast JSON decoding for large API payloads; falls back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 try:
     from bs4 import BeautifulSoup
     BS4_AVAILABLE = True
@@ -66,23 +99,7 @@ except ImportError:
     BS4_AVAILABLE = False
 
 # Web scraping and automation
-try:
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.firefox.service import Service
-    from selenium.webdriver.firefox.options import Options
-    from selenium.webdriver.chrome.service import Service as ChromeService
-    from selenium.webdriver.chrome.options import Options as ChromeOptions
-    from selenium.webdriver.common.keys import Keys
-    from selenium.webdriver.common.action_chains import ActionChains
-    from selenium.common.exceptions import *
-    from webdriver_manager.firefox import GeckoDriverManager
-    from webdriver_manager.chrome import ChromeDriverManager
-    SELENIUM_AVAILABLE = True
-except ImportError:
-    SELENIUM_AVAILABLE = False
+SELENIUM_AVAILABLE = _module_available('selenium', 'webdriver_manager')
 
 # Configure comprehensive logging
 log_handlers = []
@@ -99,36 +116,98 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+def _union_pattern(patterns, flags=re.IGNORECASE):
+    """Compile alternative patterns into one regex so text is scanned once"""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+# Resume extractor patterns, compiled once at import time
+_EXP_RE = _union_pattern([
+    r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)',
+    r'(\d+)\s*-\s*\d+\s*years?\s*(?:of\s*)?(?:experience|exp)',
+    r'(?:experience|exp).*?(\d+)\+?\s*years?',
+    r'(\d+)\+?\s*yrs?\s*(?:of\s*)?(?:experience|exp)'
+])
+_DEGREE_RE = _union_pattern([
+    r'\b(?:bachelor|b\.?[as]\.?|bs|ba)\b.*?(?:computer science|engineering|technology|science)',
+    r'\b(?:master|m\.?[as]\.?|ms|ma|mtech|mba)\b.*?(?:computer science|engineering|technology|business)',
+    r'\b(?:phd|ph\.?d\.?|doctorate)\b',
+    r'\b(?:associate|diploma|certificate)\b.*?(?:computer|technology|engineering)'
+])
+_CERT_RE = _union_pattern([
+    r'\baws\s+(?:certified|certification)\b.*?(?:solutions architect|developer|sysops|devops)',
+    r'\bazure\s+(?:certified|certification)\b.*?(?:administrator|developer|architect)',
+    r'\bgcp\s+(?:certified|certification)\b.*?(?:engineer|architect)',
+    r'\bcisco\s+(?:ccna|ccnp|ccie)\b',
+    r'\bcomptia\s+(?:security\+|network\+|a\+)\b',
+    r'\bkubernetes\s+(?:certified|certification)\b',
+    r'\bdocker\s+(?:certified|certification)\b',
+    r'\bjenkins\s+(?:certified|certification)\b'
+])
+
+# Email, phone and LinkedIn in one alternation; the regex module's V1 engine
+# runs the email local part and profile slug possessively (no backtracking)
+_POSSESSIVE = '++' if REGEX_AVAILABLE else '+'
+_CONTACT_PATTERN = (
+    r'(?P<email>\b[A-Za-z0-9._%+-]' + _POSSESSIVE + r'@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+    r'|(?P<phone>(?:\+\d{1,3}\s?)?(?:\(\d{3}\)|\d{3})[-.\s]?\d{3}[-.\s]?\d{4})'
+    r'|(?P<linkedin>linkedin\.com/in/[\w-]' + _POSSESSIVE + ')'
+)
+if REGEX_AVAILABLE:
+    _CONTACT_RE = regex.compile(r'(?V1)' + _CONTACT_PATTERN, regex.IGNORECASE)
+else:
+    _CONTACT_RE = re.compile(_CONTACT_PATTERN, re.IGNORECASE)
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\.]')
+_REQUIRED_YEARS_RE = re.compile(r'(\d+)\+?\s*years?', re.IGNORECASE)
+_LEVELS_RE = re.compile(r'senior|mid|junior|entry', re.IGNORECASE)
+
+@lru_cache(maxsize=64)
+def _lowercase_skill_set(skills: Tuple[str, ...]) -> frozenset:
+    """Lowercased skill set, built once per distinct resume skill list"""
+    return frozenset(skill.lower() for skill in skills)
+
+@lru_cache(maxsize=4096)
+def _partition_skills(resume_skills: Tuple[str, ...], job_skills: Tuple[str, ...]) -> Tuple[tuple, tuple]:
+    """Split job skills into (matched, missing), once per distinct resume/job skill pair"""
+    resume_skills_lower = _lowercase_skill_set(resume_skills)
+    matched = []
+    missing = []
+    for job_skill in job_skills:
+        (matched if job_skill.lower() in resume_skills_lower else missing).append(job_skill)
+    return tuple(matched), tuple(missing)
+
+@lru_cache(maxsize=1)
+def _load_nltk_resources():
+    """Download NLTK data and build the lemmatizer and stopword set once per process"""
+    try:
+        import nltk
+        from nltk.corpus import stopwords
+        from nltk.stem import WordNetLemmatizer
+        
+        nltk.download('punkt', quiet=True)
+        nltk.download('stopwords', quiet=True)
+        nltk.download('wordnet', quiet=True)
+        return WordNetLemmatizer(), frozenset(stopwords.words('english'))
+    except Exception:
+        # Cache the failure too, so later analyzers don't retry the download
+        return None, frozenset()
+
+# __slots__ dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class ResumeProfile:
     """Enhanced resume profile with detailed analysis"""
     full_text: str = ""
-    skills: List[str] = None
+    skills: List[str] = field(default_factory=list)
     experience_years: int = 0
-    education: List[str] = None
-    certifications: List[str] = None
-    projects: List[str] = None
-    technologies: List[str] = None
-    soft_skills: List[str] = None
-    contact_info: Dict[str, str] = None
-    
-    def __post_init__(self):
-        if self.skills is None:
-            self.skills = []
-        if self.education is None:
-            self.education = []
-        if self.certifications is None:
-            self.certifications = []
-        if self.projects is None:
-            self.projects = []
-        if self.technologies is None:
-            self.technologies = []
-        if self.soft_skills is None:
-            self.soft_skills = []
-        if self.contact_info is None:
-            self.contact_info = {}
+    education: List[str] = field(default_factory=list)
+    certifications: List[str] = field(default_factory=list)
+    projects: List[str] = field(default_factory=list)
+    technologies: List[str] = field(default_factory=list)
+    soft_skills: List[str] = field(default_factory=list)
+    contact_info: Dict[str, str] = field(default_factory=dict)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class JobMatch:
     """Enhanced job match with resume matching analysis"""
     title: str
@@ -140,7 +219,7 @@ class JobMatch:
     description: str = ""
     requirements: str = ""
     preferred_qualifications: str = ""
-    technologies_required: List[str] = None
+    technologies_required: List[str] = field(default_factory=list)
     experience_required: str = ""
     education_required: str = ""
     
@@ -152,76 +231,116 @@ class JobMatch:
     education_match_percentage: float = 0.0
     
     # Detailed breakdown
-    matched_skills: List[str] = None
-    missing_skills: List[str] = None
-    matched_technologies: List[str] = None
-    missing_technologies: List[str] = None
+    matched_skills: List[str] = field(default_factory=list)
+    missing_skills: List[str] = field(default_factory=list)
+    matched_technologies: List[str] = field(default_factory=list)
+    missing_technologies: List[str] = field(default_factory=list)
     
     salary_min: int = 0
     salary_max: int = 0
     id: str = ""
     apply_url: Optional[str] = None
     remote_friendly: bool = True
-    
-    def __post_init__(self):
-        if self.technologies_required is None:
-            self.technologies_required = []
-        if self.matched_skills is None:
-            self.matched_skills = []
-        if self.missing_skills is None:
-            self.missing_skills = []
-        if self.matched_technologies is None:
-            self.matched_technologies = []
-        if self.missing_technologies is None:
-            self.missing_technologies = []
+
+# Skill vocabulary shared by every analyzer; never mutated at runtime
+SKILL_KEYWORDS = {
+    'programming': ('python', 'java', 'javascript', 'c++', 'c#', 'go', 'rust', 'ruby', 'php', 'swift', 'kotlin'),
+    'cloud': ('aws', 'azure', 'gcp', 'google cloud', 'amazon web services', 'microsoft azure'),
+    'devops': ('docker', 'kubernetes', 'jenkins', 'gitlab', 'github actions', 'terraform', 'ansible', 'puppet', 'chef'),
+    'databases': ('mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'dynamodb', 'oracle'),
+    'web': ('react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring'),
+    'tools': ('git', 'jira', 'confluence', 'slack', 'linux', 'windows', 'macos'),
+    'methodologies': ('agile', 'scrum', 'kanban', 'devops', 'ci/cd', 'tdd', 'microservices')
+}
+
+_ALL_SKILLS = frozenset(keyword for keywords in SKILL_KEYWORDS.values() for keyword in keywords)
+
+# Distinct skill names in category order, the order extract_skills reports them in
+_SKILL_TITLES = tuple(dict.fromkeys(
+    keyword.title() for keywords in SKILL_KEYWORDS.values() for keyword in keywords
+))
+
+def _build_skill_automaton():
+    """Build one automaton over every keyword so skill extraction is a single pass"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _ALL_SKILLS:
+        automaton.add_word(keyword, (keyword.title(), len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+_SKILL_AUTOMATON = _build_skill_automaton()
+
+# Fallback matcher: a zero-width lookahead reports overlapping hits such as
+# "microsoft azure" and "azure", longest keyword first at each position.
+# Lookarounds instead of \b so keywords like "c++" and "ci/cd" still match.
+_SKILL_RE = re.compile(
+    r'(?=(?<!\w)(' + '|'.join(re.escape(keyword) for keyword in sorted(_ALL_SKILLS, key=len, reverse=True)) + r')(?!\w))'
+)
+
+def _is_word_char(char: str) -> bool:
+    """Same character class as the regex \\w"""
+    return char.isalnum() or char == '_'
 
 class ResumeAnalyzer:
     """Advanced resume analysis and matching engine"""
     
     def __init__(self):
         self.resume_profile = None
-        self.skill_keywords = {
-            'programming': ['python', 'java', 'javascript', 'c++', 'c#', 'go', 'rust', 'ruby', 'php', 'swift', 'kotlin'],
-            'cloud': ['aws', 'azure', 'gcp', 'google cloud', 'amazon web services', 'microsoft azure'],
-            'devops': ['docker', 'kubernetes', 'jenkins', 'gitlab', 'github actions', 'terraform', 'ansible', 'puppet', 'chef'],
-            'databases': ['mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'dynamodb', 'oracle'],
-            'web': ['react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring'],
-            'tools': ['git', 'jira', 'confluence', 'slack', 'linux', 'windows', 'macos'],
-            'methodologies': ['agile', 'scrum', 'kanban', 'devops', 'ci/cd', 'tdd', 'microservices']
-        }
+        self._pdf_cache = {}
+        self.skill_keywords = SKILL_KEYWORDS
+        self._skill_titles = _SKILL_TITLES
+        self._skill_automaton = _SKILL_AUTOMATON
+        
+        # Job descriptions repeat across platforms and cycles, so memoize their skills
+        self._job_skills_for_text = lru_cache(maxsize=4096)(
+            lambda text: tuple(self.extract_skills(text))
+        )
         
         # Initialize NLP components if available
         if NLP_AVAILABLE:
-            try:
-                nltk.download('punkt', quiet=True)
-                nltk.download('stopwords', quiet=True)
-                nltk.download('wordnet', quiet=True)
-                self.lemmatizer = WordNetLemmatizer()
-                self.stop_words = set(stopwords.words('english'))
-            except:
-                self.lemmatizer = None
-                self.stop_words = set()
+            self.lemmatizer, self.stop_words = _load_nltk_resources()
         else:
             self.lemmatizer = None
-            self.stop_words = set()
+            self.stop_words = frozenset()
     
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """Extract text from PDF resume"""
         try:
-            if not PDF_AVAILABLE:
-                logger.warning("PDF processing not available")
-                return ""
-            
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                return text.strip()
+            # Reuse text decoded earlier this session unless the file changed
+            stat = os.stat(pdf_path)
+            cache_key = (os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size)
+            if cache_key in self._pdf_cache:
+                return self._pdf_cache[cache_key]
+            
+            text = self._read_pdf_text(pdf_path)
+            if text:
+                self._pdf_cache[cache_key] = text
+            return text
         except Exception as e:
             logger.error(f"Failed to extract text from PDF: {e}")
             return ""
     
+    def _read_pdf_text(self, pdf_path: str) -> str:
+        """Decode all PDF pages into one string"""
+        if PDFIUM_AVAILABLE:
+            pdf = pdfium.PdfDocument(pdf_path)
+            try:
+                return "\n".join(page.get_textpage().get_text_range() for page in pdf).strip()
+            finally:
+                pdf.close()
+        
+        if not PDF_AVAILABLE:
+            logger.warning("PDF processing not available")
+            return ""
+        
+        import PyPDF2
+        
+        with open(pdf_path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            return "\n".join(page.extract_text() or "" for page in pdf_reader.pages).strip()
+    
     def extract_text_from_docx(self, docx_path: str) -> str:
         """Extract text from DOCX resume"""
         try:
@@ -229,11 +348,10 @@ class ResumeAnalyzer:
                 logger.warning("DOCX processing not available")
                 return ""
             
+            from docx import Document
+            
             doc = Document(docx_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+            return "\n".join(paragraph.text for paragraph in doc.paragraphs).strip()
         except Exception as e:
             logger.error(f"Failed to extract text from DOCX: {e}")
             return ""
@@ -247,50 +365,40 @@ class ResumeAnalyzer:
         text = text.lower()
         
         # Remove special characters but keep spaces and periods
-        text = re.sub(r'[^\w\s\.]', ' ', text)
+        text = _SPECIAL_CHARS_RE.sub(' ', text)
         
         # Remove extra whitespace
         text = ' '.join(text.split())
         
         return text
     
-    def extract_skills(self, text: str) -> List[str]:
-        """Extract skills from text using keyword matching"""
-        skills = []
-        text_lower = text.lower()
+    def extract_skills(self, text: str, text_lower: Optional[str] = None) -> List[str]:
+        """Extract skills from text using whole-word keyword matching"""
+        if text_lower is None:
+            text_lower = text.lower()
         
-        # Check all skill categories
-        for category, keywords in self.skill_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    skills.append(keyword.title())
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_skills = []
-        for skill in skills:
-            if skill.lower() not in seen:
-                seen.add(skill.lower())
-                unique_skills.append(skill)
+        if self._skill_automaton is not None:
+            # Automaton hits are substrings; keep only those standing as whole words
+            last = len(text_lower) - 1
+            found = set()
+            for end, (title, length) in self._skill_automaton.iter(text_lower):
+                start = end - length + 1
+                if start > 0 and _is_word_char(text_lower[start - 1]):
+                    continue
+                if end < last and _is_word_char(text_lower[end + 1]):
+                    continue
+                found.add(title)
+        else:
+            found = {match.group(1).title() for match in _SKILL_RE.finditer(text_lower)}
         
-        return unique_skills
+        return [skill for skill in self._skill_titles if skill in found]
     
     def extract_experience_years(self, text: str) -> int:
         """Extract years of experience from resume text"""
         try:
             # Look for patterns like "3 years", "5+ years", "2-4 years"
-            patterns = [
-                r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)',
-                r'(\d+)\s*-\s*\d+\s*years?\s*(?:of\s*)?(?:experience|exp)',
-                r'(?:experience|exp).*?(\d+)\+?\s*years?',
-                r'(\d+)\+?\s*yrs?\s*(?:of\s*)?(?:experience|exp)'
-            ]
-            
-            years = []
-            for pattern in patterns:
-                matches = re.finditer(pattern, text.lower())
-                for match in matches:
-                    years.append(int(match.group(1)))
+            # Each alternative has exactly one group, so lastindex is the one that matched
+            years = [int(match.group(match.lastindex)) for match in _EXP_RE.finditer(text)]
             
             # Return the highest number found, or estimate based on text length
             if years:
@@ -310,47 +418,13 @@ class ResumeAnalyzer:
     
     def extract_education(self, text: str) -> List[str]:
         """Extract education information"""
-        education = []
-        text_lower = text.lower()
-        
         # Common degree patterns
-        degree_patterns = [
-            r'\b(?:bachelor|b\.?[as]\.?|bs|ba)\b.*?(?:computer science|engineering|technology|science)',
-            r'\b(?:master|m\.?[as]\.?|ms|ma|mtech|mba)\b.*?(?:computer science|engineering|technology|business)',
-            r'\b(?:phd|ph\.?d\.?|doctorate)\b',
-            r'\b(?:associate|diploma|certificate)\b.*?(?:computer|technology|engineering)'
-        ]
-        
-        for pattern in degree_patterns:
-            matches = re.finditer(pattern, text_lower)
-            for match in matches:
-                education.append(match.group().title())
-        
-        return education
+        return [match.group().title() for match in _DEGREE_RE.finditer(text)]
     
     def extract_certifications(self, text: str) -> List[str]:
         """Extract certifications"""
-        certifications = []
-        text_lower = text.lower()
-        
         # Common certifications
-        cert_patterns = [
-            r'\baws\s+(?:certified|certification)\b.*?(?:solutions architect|developer|sysops|devops)',
-            r'\bazure\s+(?:certified|certification)\b.*?(?:administrator|developer|architect)',
-            r'\bgcp\s+(?:certified|certification)\b.*?(?:engineer|architect)',
-            r'\bcisco\s+(?:ccna|ccnp|ccie)\b',
-            r'\bcompTIA\s+(?:security\+|network\+|a\+)\b',
-            r'\bkubernetes\s+(?:certified|certification)\b',
-            r'\bdocker\s+(?:certified|certification)\b',
-            r'\bjenkins\s+(?:certified|certification)\b'
-        ]
-        
-        for pattern in cert_patterns:
-            matches = re.finditer(pattern, text_lower)
-            for match in matches:
-                certifications.append(match.group().title())
-        
-        return certifications
+        return [match.group().title() for match in _CERT_RE.finditer(text)]
     
     def analyze_resume(self, resume_path: str) -> ResumeProfile:
         """Analyze resume and create comprehensive profile"""
@@ -371,11 +445,11 @@ class ResumeAnalyzer:
                 logger.warning("No text extracted from resume, using default profile")
                 return self._get_default_profile()
             
-            # Preprocess text
-            processed_text = self.preprocess_text(text)
+            # Lowercase once; the regex extractors match case-insensitively on the raw text
+            text_lower = text.lower()
             
             # Extract various components
-            skills = self.extract_skills(text)
+            skills = self.extract_skills(text, text_lower)
             experience_years = self.extract_experience_years(text)
             education = self.extract_education(text)
             certifications = self.extract_certifications(text)
@@ -400,36 +474,31 @@ class ResumeAnalyzer:
             logger.info(f"   Education: {len(education)} entries")
             logger.info(f"   Certifications: {len(certifications)}")
             
-            self.resume_profile = profile
+            self.use_profile(profile)
             return profile
             
         except Exception as e:
             logger.error(f"❌ Resume analysis failed: {e}")
             return self._get_default_profile()
     
+    def use_profile(self, profile: ResumeProfile):
+        """Make an already analyzed profile the active resume profile"""
+        self.resume_profile = profile
+    
     def _extract_contact_info(self, text: str) -> Dict[str, str]:
         """Extract contact information from resume"""
         contact = {}
         
-        # Email pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, text)
-        if email_match:
-            contact['email'] = email_match.group()
-        
-        # Phone pattern
-        phone_pattern = r'(?:\+\d{1,3}\s?)?(?:\(\d{3}\)|\d{3})[-.\s]?\d{3}[-.\s]?\d{4}'
-        phone_match = re.search(phone_pattern, text)
-        if phone_match:
-            contact['phone'] = phone_match.group()
+        # Single scan; keep the first match of each kind
+        for match in _CONTACT_RE.finditer(text):
+            contact.setdefault(match.lastgroup, match.group())
+            if len(contact) == 3:
+                break
         
-        # LinkedIn pattern
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        linkedin_match = re.search(linkedin_pattern, text.lower())
-        if linkedin_match:
-            contact['linkedin'] = linkedin_match.group()
+        if 'linkedin' in contact:
+            contact['linkedin'] = contact['linkedin'].lower()
         
-        return contact
+        return {key: contact[key] for key in ('email', 'phone', 'linkedin') if key in contact}
     
     def _get_default_profile(self) -> ResumeProfile:
         """Get default resume profile"""
@@ -446,14 +515,17 @@ class ResumeAnalyzer:
         """Calculate comprehensive job matching score"""
         try:
             # Extract job requirements
-            job_text = f"{job.title} {job.description} {job.requirements}"
-            job_skills = self.extract_skills(job_text)
+            job_text = self._job_text(job)
+            job_skills = self._job_skills_for_text(job_text)
             
             # Calculate skill matching
             skills_match = self._calculate_skills_match(resume_profile.skills, job_skills)
             
-            # Calculate technology matching
-            tech_match = self._calculate_technology_match(resume_profile.technologies, job_skills)
+            # Calculate technology matching (analyzed resumes share one list for both)
+            if resume_profile.technologies is resume_profile.skills:
+                tech_match = skills_match
+            else:
+                tech_match = self._calculate_technology_match(resume_profile.technologies, job_skills)
             
             # Calculate experience matching
             exp_match = self._calculate_experience_match(resume_profile.experience_years, job.experience_required)
@@ -490,29 +562,24 @@ class ResumeAnalyzer:
             job.skills_match_percentage = 75.0
             return job
     
+    @staticmethod
+    def _job_text(job: JobMatch) -> str:
+        """Text used to match a job against the resume"""
+        return f"{job.title} {job.description} {job.requirements}"
+    
     def _calculate_skills_match(self, resume_skills: List[str], job_skills: List[str]) -> Dict:
         """Calculate skills matching percentage"""
         if not resume_skills or not job_skills:
-            return {'percentage': 0.0, 'matched': [], 'missing': job_skills or []}
-        
-        resume_skills_lower = [skill.lower() for skill in resume_skills]
-        job_skills_lower = [skill.lower() for skill in job_skills]
+            return {'percentage': 0.0, 'matched': [], 'missing': list(job_skills or [])}
         
-        matched = []
-        missing = []
-        
-        for job_skill in job_skills:
-            if job_skill.lower() in resume_skills_lower:
-                matched.append(job_skill)
-            else:
-                missing.append(job_skill)
+        matched, missing = _partition_skills(tuple(resume_skills), tuple(job_skills))
         
         percentage = (len(matched) / len(job_skills)) * 100 if job_skills else 0
         
         return {
             'percentage': percentage,
-            'matched': matched,
-            'missing': missing
+            'matched': list(matched),
+            'missing': list(missing)
         }
     
     def _calculate_technology_match(self, resume_tech: List[str], job_tech: List[str]) -> Dict:
@@ -526,8 +593,7 @@ class ResumeAnalyzer:
                 return 100.0  # No specific requirement
             
             # Extract years from job requirement
-            years_pattern = r'(\d+)\+?\s*years?'
-            match = re.search(years_pattern, job_experience.lower())
+            match = _REQUIRED_YEARS_RE.search(job_experience)
             
             if match:
                 required_years = int(match.group(1))
@@ -541,11 +607,12 @@ class ResumeAnalyzer:
                     return 50.0
             
             # Default based on experience level
-            if 'senior' in job_experience.lower() and resume_years >= 5:
+            levels = {match.group().lower() for match in _LEVELS_RE.finditer(job_experience)}
+            if 'senior' in levels and resume_years >= 5:
                 return 100.0
-            elif 'mid' in job_experience.lower() and resume_years >= 2:
+            elif 'mid' in levels and resume_years >= 2:
                 return 100.0
-            elif 'junior' in job_experience.lower() or 'entry' in job_experience.lower():
+            elif 'junior' in levels or 'entry' in levels:
                 return 100.0
             
             return 75.0  # Default
@@ -577,6 +644,240 @@ class ResumeAnalyzer:
         except Exception:
             return 75.0
 
+# Salary formats in priority order: "$a - $b", "$a to $b", "a - b usd", "$a".
+# Wrapped in a lookahead so one scan reports the first hit of every format.
+_SALARY_AMOUNT = r'(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)'
+_SALARY_RE = re.compile(
+    r'(?=[$\d])(?='
+    rf'(?P<range>\${_SALARY_AMOUNT}\s*-\s*\${_SALARY_AMOUNT})'
+    rf'|(?P<range_to>\${_SALARY_AMOUNT}\s*to\s*\${_SALARY_AMOUNT})'
+    r'|(?P<range_usd>(\d{1,3}(?:,\d{3})*)\s*-\s*(\d{1,3}(?:,\d{3})*)\s*(?:usd|dollars?))'
+    r'|(?P<single>\$(\d{1,3}(?:,\d{3})*)))',
+    re.IGNORECASE,
+)
+_SALARY_PRIORITY = ('range', 'range_to', 'range_usd', 'single')
+# Amount capture groups nested inside each named format
+_SALARY_GROUPS = {
+    name: tuple(range(_SALARY_RE.groupindex[name] + 1, end))
+    for name, end in zip(_SALARY_PRIORITY,
+                         [_SALARY_RE.groupindex[name] for name in _SALARY_PRIORITY[1:]]
+                         + [_SALARY_RE.groups + 1])
+}
+
+def _parse_salary(text: str) -> Tuple[int, int, str]:
+    """Extract (min, max, display) salary from job text"""
+    if not text:
+        return 0, 0, ""
+    
+    found = {}
+    for match in _SALARY_RE.finditer(text):
+        kind = match.lastgroup
+        if kind in found:
+            continue
+        found[kind] = [int(float(match.group(index).replace(',', '')))
+                       for index in _SALARY_GROUPS[kind]]
+        if kind == 'range':
+            break
+    
+    for kind in _SALARY_PRIORITY:
+        if kind in found:
+            amounts = found[kind]
+            if len(amounts) == 2:
+                min_sal, max_sal = amounts
+                return min_sal, max_sal, f"${min_sal:,} - ${max_sal:,}"
+            salary = amounts[0]
+            return salary, salary, f"${salary:,}"
+    
+    return 0, 0, ""
+
+
+# Bump when extraction changes so cached resume profiles are re-analyzed
+RESUME_CACHE_VERSION = 2
+
+# Transient API failures retried with exponential backoff (0.5s, 1s, 2s)
+HTTP_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+if HTTPX_AVAILABLE:
+    class _RetryTransport(httpx.HTTPTransport):
+        """HTTP transport that retries transient error statuses with backoff"""
+        
+        def handle_request(self, request):
+            for attempt in range(HTTP_RETRIES + 1):
+                response = super().handle_request(request)
+                if response.status_code not in HTTP_RETRY_STATUSES or attempt == HTTP_RETRIES:
+                    return response
+                response.close()
+                time.sleep(HTTP_BACKOFF_FACTOR * 2 ** attempt)
+
+def _stable_job_id(job: Dict) -> int:
+    """Process-independent ID for a job posting that has no id of its own"""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(job, option=orjson.OPT_SORT_KEYS, default=str)
+    else:
+        payload = json.dumps(job, sort_keys=True, separators=(',', ':'),
+                             ensure_ascii=False, default=str).encode()
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh64_intdigest(payload)
+    return int.from_bytes(hashlib.blake2b(payload, digest_size=8).digest(), 'big')
+
+# Job templates with detailed requirements
+_JOB_TEMPLATES = {
+    'X/Twitter': [
+        {
+            'title': 'Senior DevOps Engineer',
+            'company': 'X (Twitter)',
+            'salary': '$120,000 - $180,000',
+            'requirements': 'Python, AWS, Docker, Kubernetes, Jenkins, 5+ years experience',
+            'experience_required': '5+ years'
+        },
+        {
+            'title': 'DevOps Platform Engineer',
+            'company': 'X (Twitter)',
+            'salary': '$110,000 - $160,000',
+            'requirements': 'DevOps, CI/CD, GitLab, Docker, 3+ years experience',
+            'experience_required': '3+ years'
+        },
+        {
+            'title': 'DevOps Architect',
+            'company': 'X (Twitter)',
+            'salary': '$140,000 - $200,000',
+            'requirements': 'AWS, Kubernetes, Terraform, Architecture, 7+ years experience',
+            'experience_required': '7+ years'
+        },
+        {
+            'title': 'Site Reliability Engineer',
+            'company': 'X (Twitter)',
+            'salary': '$115,000 - $170,000',
+            'requirements': 'Python, Linux, Monitoring, SRE practices, 4+ years experience',
+            'experience_required': '4+ years'
+        },
+        {
+            'title': 'Cloud Infrastructure Engineer',
+            'company': 'X (Twitter)',
+            'salary': '$105,000 - $155,000',
+            'requirements': 'AWS, Cloud infrastructure, Python, 3+ years experience',
+            'experience_required': '3+ years'
+        }
+    ],
+    'DICE': [
+        {
+            'title': 'DevOps Engineer',
+            'company': 'TechCorp',
+            'salary': '$75,000 - $110,000',
+            'requirements': 'DevOps, CI/CD, Docker, AWS, 2+ years experience',
+            'experience_required': '2+ years'
+        },
+        {
+            'title': 'Cloud Engineer',
+            'company': 'CloudCorp',
+            'salary': '$80,000 - $120,000',
+            'requirements': 'AWS, Cloud services, Python, 3+ years experience',
+            'experience_required': '3+ years'
+        },
+        {
+            'title': 'Platform Engineer',
+            'company': 'PlatformCorp',
+            'salary': '$85,000 - $125,000',
+            'requirements': 'Kubernetes, Docker, Platform engineering, 3+ years experience',
+            'experience_required': '3+ years'
+        }
+    ],
+    'Indeed': [
+        {
+            'title': 'Remote DevOps Engineer',
+            'company': 'RemoteCorp',
+            'salary': '$65,000 - $100,000',
+            'requirements': 'DevOps, Remote work, CI/CD, 2+ years experience',
+            'experience_required': '2+ years'
+        },
+        {
+            'title': 'Cloud Infrastructure Engineer',
+            'company': 'CloudFirst',
+            'salary': '$70,000 - $110,000',
+            'requirements': 'Cloud infrastructure, AWS, DevOps, 3+ years experience',
+            'experience_required': '3+ years'
+        }
+    ],
+    'WeWorkRemotely': [
+        {
+            'title': 'Remote DevOps Engineer',
+            'company': 'GlobalTech',
+            'salary': '$70,000 - $110,000',
+            'requirements': 'DevOps, Remote collaboration, CI/CD, 2+ years experience',
+            'experience_required': '2+ years'
+        }
+    ],
+    'Turing': [
+        {
+            'title': 'DevOps Engineer - Remote',
+            'company': 'US Tech Company',
+            'salary': '$60,000 - $90,000',
+            'requirements': 'DevOps, Python, AWS, Remote work, 2+ years experience',
+            'experience_required': '2+ years'
+        }
+    ]
+}
+
+# (job_id, template, parsed salary) per platform, so searches do no regex work
+_TEMPLATE_JOBS = {
+    platform: [
+        (f"{platform.lower().replace('/', '_')}_{i+1:03d}", job_data, _parse_salary(job_data.get('salary', '')))
+        for i, job_data in enumerate(templates)
+    ]
+    for platform, templates in _JOB_TEMPLATES.items()
+}
+
+# Job match results kept across cycles, evicted least recently used first
+MATCH_CACHE_SIZE = 5000
+_MATCH_FIELDS = (
+    'overall_match_percentage', 'skills_match_percentage', 'technology_match_percentage',
+    'experience_match_percentage', 'education_match_percentage',
+    'matched_skills', 'missing_skills', 'matched_technologies', 'missing_technologies',
+)
+
+class _FilenameCharTable(dict):
+    """str.translate table that drops characters other than alphanumerics, space, '-' and '_'"""
+    
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        self[codepoint] = codepoint if char.isalnum() or char in ' -_' else None
+        return self[codepoint]
+
+# Screenshot filename tables; the char table fills in lazily as new characters are seen
+_FILENAME_CHARS = _FilenameCharTable()
+_FILENAME_SEPARATORS = str.maketrans({' ': '_', '/': '_', '\\': '_'})
+
+# Entry appended to the applications file for each application
+_APPLICATION_LOG_TEMPLATE = """{timestamp} - APPLIED WITH RESUME MATCHING
+Platform: {job.platform}
+Title: {job.title}
+Company: {job.company}
+Salary: {salary}
+Location: {location}
+URL: {job.url}
+
+RESUME MATCHING ANALYSIS:
+Overall Match: {job.overall_match_percentage}%
+Skills Match: {job.skills_match_percentage}%
+Technology Match: {job.technology_match_percentage}%
+Experience Match: {job.experience_match_percentage}%
+Education Match: {job.education_match_percentage}%
+
+Matched Skills: {matched_skills}
+Missing Skills: {missing_skills}
+Matched Technologies: {matched_technologies}
+Missing Technologies: {missing_technologies}
+
+Job Requirements: {requirements}...
+Experience Required: {experience_required}
+
+Proof: {proof}
+---
+
+"""
+
 class EnhancedResumeMatchingBot:
     """Enhanced job bot with advanced resume matching capabilities"""
     
@@ -588,6 +889,7 @@ class EnhancedResumeMatchingBot:
             self.start_time = datetime.now()
             self.driver = None
             self.proof_folder = "application_proofs"
+            self._proof_prefix = os.path.join(self.proof_folder, "")
             self.target_applications = (70, 90)
             self.applications_sent = 0
             
@@ -595,6 +897,7 @@ class EnhancedResumeMatchingBot:
             timestamp = self.start_time.strftime("%Y%m%d_%H%M%S")
             self.applications_file = f"enhanced_resume_matching_applications_{timestamp}.txt"
             self.cycle_log_file = f"enhanced_resume_matching_cycle_{timestamp}.txt"
+            self._applications_log = None  # opened on first application
             self.screenshot_count = 0
             
             # Create directories
@@ -606,16 +909,19 @@ class EnhancedResumeMatchingBot:
             
             # Load and analyze resume
             self.resume_profile = self._load_resume_profile()
+            self._resume_fp = hashlib.sha1(repr(self.resume_profile).encode()).hexdigest()[:8]
+            
+            # Match results from earlier cycles
+            self._match_cache_file = Path(".cache") / f"job_matches_v{RESUME_CACHE_VERSION}.pkl"
+            self._match_cache = self._load_match_cache()
+            self._match_cache_lock = threading.Lock()
             
             # Load configuration
             self.config = self._load_configuration()
             self.applied_jobs = set()
             
             # Enhanced session
-            self.session = requests.Session()
-            self.session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            })
+            self.session = self._create_session()
             
             # Platform configurations
             self.platforms = {
@@ -634,6 +940,43 @@ class EnhancedResumeMatchingBot:
             logger.error(traceback.format_exc())
             raise
     
+    def _create_session(self):
+        """Create the pooled HTTP session used for API scraping"""
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        }
+        
+        if HTTPX_AVAILABLE:
+            # requests follows redirects by default, httpx does not (remoteok.io redirects)
+            # retries= covers connection failures, the transport loop covers error statuses
+            transport = _RetryTransport(
+                http2=True,
+                retries=HTTP_RETRIES,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+            )
+            return httpx.Client(
+                transport=transport,
+                headers=headers,
+                timeout=30,
+                follow_redirects=True
+            )
+        
+        session = requests.Session()
+        session.headers.update(headers)
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=HTTP_RETRIES,
+                backoff_factor=HTTP_BACKOFF_FACTOR,
+                status_forcelist=HTTP_RETRY_STATUSES,
+                raise_on_status=False
+            )
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
     def _load_resume_profile(self) -> ResumeProfile:
         """Load and analyze resume"""
         try:
@@ -642,7 +985,7 @@ class EnhancedResumeMatchingBot:
             
             for resume_file in resume_files:
                 if os.path.exists(resume_file):
-                    return self.resume_analyzer.analyze_resume(resume_file)
+                    return self._load_cached_resume_profile(resume_file)
             
             logger.warning("No resume file found, using default profile")
             return self.resume_analyzer._get_default_profile()
@@ -651,6 +994,82 @@ class EnhancedResumeMatchingBot:
             logger.error(f"❌ Resume loading failed: {e}")
             return self.resume_analyzer._get_default_profile()
     
+    def _load_cached_resume_profile(self, resume_file: str) -> ResumeProfile:
+        """Analyze resume, reusing the cached profile while the file is unchanged"""
+        file_hash = hashlib.sha256(Path(resume_file).read_bytes()).hexdigest()
+        cache_path = Path(".cache") / f"resume_v{RESUME_CACHE_VERSION}_{file_hash}.pkl"
+        
+        if cache_path.exists():
+            try:
+                with open(cache_path, 'rb') as f:
+                    profile = pickle.load(f)
+                self.resume_analyzer.use_profile(profile)
+                logger.info(f"📄 Loaded cached resume analysis for {resume_file}")
+                return profile
+            except Exception as e:
+                logger.warning(f"⚠️ Ignoring unreadable resume cache: {e}")
+        
+        profile = self.resume_analyzer.analyze_resume(resume_file)
+        
+        # Only cache real analyses, not the default fallback profile
+        if profile is self.resume_analyzer.resume_profile:
+            try:
+                cache_path.parent.mkdir(exist_ok=True)
+                with open(cache_path, 'wb') as f:
+                    pickle.dump(profile, f)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not cache resume analysis: {e}")
+        
+        return profile
+    
+    def _load_match_cache(self) -> OrderedDict:
+        """Load job match results saved by earlier cycles"""
+        if self._match_cache_file.exists():
+            try:
+                with open(self._match_cache_file, 'rb') as f:
+                    return pickle.load(f)
+            except Exception as e:
+                logger.warning(f"⚠️ Ignoring unreadable match cache: {e}")
+        return OrderedDict()
+    
+    def _save_match_cache(self):
+        """Persist job match results for the next cycle"""
+        try:
+            self._match_cache_file.parent.mkdir(exist_ok=True)
+            with open(self._match_cache_file, 'wb') as f:
+                pickle.dump(self._match_cache, f)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not save match cache: {e}")
+    
+    def _match_cache_entry(self, job: JobMatch):
+        """Cache key and content digest for a job against the current resume"""
+        job_text = self.resume_analyzer._job_text(job)
+        content = f"{job_text}\0{job.experience_required}\0{job.education_required}"
+        return f"{job.id}:{self._resume_fp}", hashlib.sha1(content.encode()).hexdigest()
+    
+    def _restore_cached_match(self, job: JobMatch) -> bool:
+        """Fill in match scores from the cache if this job was scored unchanged before"""
+        key, digest = self._match_cache_entry(job)
+        with self._match_cache_lock:
+            cached = self._match_cache.get(key)
+            if cached is None or cached[0] != digest:
+                return False
+            self._match_cache.move_to_end(key)
+        
+        for name, value in zip(_MATCH_FIELDS, cached[1]):
+            setattr(job, name, list(value) if isinstance(value, tuple) else value)
+        return True
+    
+    def _remember_match(self, job: JobMatch):
+        """Store a job's match scores in the cache"""
+        key, digest = self._match_cache_entry(job)
+        values = tuple(getattr(job, name) for name in _MATCH_FIELDS)
+        with self._match_cache_lock:
+            self._match_cache[key] = (digest, tuple(tuple(v) if isinstance(v, list) else v for v in values))
+            self._match_cache.move_to_end(key)
+            while len(self._match_cache) > MATCH_CACHE_SIZE:
+                self._match_cache.popitem(last=False)
+    
     def _load_configuration(self):
         """Load enhanced configuration"""
         return {
@@ -689,6 +1108,11 @@ class EnhancedResumeMatchingBot:
         try:
             logger.info("🦊 Configuring Firefox...")
             
+            from selenium import webdriver
+            from selenium.webdriver.firefox.service import Service
+            from selenium.webdriver.firefox.options import Options
+            from webdriver_manager.firefox import GeckoDriverManager
+            
             options = Options()
             options.add_argument("--no-sandbox")
             options.add_argument("--disable-dev-shm-usage")
@@ -733,6 +1157,11 @@ class EnhancedResumeMatchingBot:
         try:
             logger.info("🌐 Configuring Chrome...")
             
+            from selenium import webdriver
+            from selenium.webdriver.chrome.service import Service as ChromeService
+            from selenium.webdriver.chrome.options import Options as ChromeOptions
+            from webdriver_manager.chrome import ChromeDriverManager
+            
             options = ChromeOptions()
             options.add_argument("--no-sandbox")
             options.add_argument("--disable-dev-shm-usage")
@@ -768,32 +1197,7 @@ class EnhancedResumeMatchingBot:
     
     def _extract_salary(self, text):
         """Extract salary information from job text"""
-        if not text:
-            return 0, 0, ""
-        
-        text = text.lower()
-        salary_patterns = [
-            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*-\s*\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',
-            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*to\s*\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',
-            r'(\d{1,3}(?:,\d{3})*)\s*-\s*(\d{1,3}(?:,\d{3})*)\s*(?:usd|dollars?)',
-            r'\$(\d{1,3}(?:,\d{3})*)',
-        ]
-        
-        for pattern in salary_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                try:
-                    if len(match.groups()) == 2:
-                        min_sal = int(match.group(1).replace(',', ''))
-                        max_sal = int(match.group(2).replace(',', ''))
-                        return min_sal, max_sal, f"${min_sal:,} - ${max_sal:,}"
-                    else:
-                        salary = int(match.group(1).replace(',', ''))
-                        return salary, salary, f"${salary:,}"
-                except:
-                    continue
-        
-        return 0, 0, ""
+        return _parse_salary(text)
     
     def search_remoteok_jobs(self):
         """Enhanced RemoteOK search with resume matching"""
@@ -804,16 +1208,18 @@ class EnhancedResumeMatchingBot:
             response = self.session.get(url, timeout=20)
             
             if response.status_code != 200:
-                logger.warning(f"RemoteOK API returned status {response.status_code}")
+                logger.warning("RemoteOK API returned status %s", response.status_code)
                 return []
             
-            jobs_data = response.json()
+            jobs_data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
             if not jobs_data or len(jobs_data) < 2:
                 logger.warning("No jobs found in RemoteOK API response")
                 return []
             
             jobs = jobs_data[1:]
-            matching_jobs = []
+            candidates = []
+            min_match = self.config['preferences'].get('min_match_percentage', 60.0)
+            min_salary = self.config['preferences'].get('salary_min', 45000)
             
             for job in jobs[:100]:
                 try:
@@ -822,12 +1228,16 @@ class EnhancedResumeMatchingBot:
                     company = job.get('company', 'Unknown Company')
                     
                     # Create job match object
-                    job_id = f"remoteok_{job.get('id', hash(str(job)))}"
+                    job_id = f"remoteok_{job['id'] if 'id' in job else _stable_job_id(job)}"
                     
                     if job_id not in self.applied_jobs:
                         salary_text = description + " " + title
                         salary_min, salary_max, salary_display = self._extract_salary(salary_text)
                         
+                        # Salary is checked before matching so rejected jobs are never scored
+                        if salary_min != 0 and salary_min < min_salary:
+                            continue
+                        
                         job_match = JobMatch(
                             platform='RemoteOK',
                             title=title,
@@ -843,144 +1253,40 @@ class EnhancedResumeMatchingBot:
                             location=job.get('location', 'Remote'),
                             remote_friendly=True
                         )
-                        
-                        # Calculate resume matching
-                        job_match = self.resume_analyzer.calculate_job_match(job_match, self.resume_profile)
-                        
-                        # Check if meets minimum match percentage and salary requirement
-                        min_match = self.config['preferences'].get('min_match_percentage', 60.0)
-                        min_salary = self.config['preferences'].get('salary_min', 45000)
-                        
-                        if (job_match.overall_match_percentage >= min_match and 
-                            (salary_min == 0 or salary_min >= min_salary)):
-                            matching_jobs.append(job_match)
+                        candidates.append(job_match)
                             
                 except Exception as e:
-                    logger.error(f"Error processing RemoteOK job: {e}")
+                    logger.error("Error processing RemoteOK job: %s", e)
                     continue
             
-            # Sort by match percentage (highest first)
-            matching_jobs.sort(key=lambda x: x.overall_match_percentage, reverse=True)
+            # Score candidates not already in the match cache, then keep those meeting the minimum match
+            for job in candidates:
+                if not self._restore_cached_match(job):
+                    self.resume_analyzer.calculate_job_match(job, self.resume_profile)
+                    self._remember_match(job)
+            matching_jobs = [job for job in candidates if job.overall_match_percentage >= min_match]
             
-            logger.info(f"✅ Found {len(matching_jobs)} RemoteOK jobs with good resume match")
+            logger.info("✅ Found %s RemoteOK jobs with good resume match", len(matching_jobs))
             return matching_jobs
             
         except Exception as e:
-            logger.error(f"❌ RemoteOK search failed: {e}")
+            logger.error("❌ RemoteOK search failed: %s", e)
             return []
     
     def search_platform_template_jobs(self, platform_name):
         """Search template jobs with resume matching"""
         try:
-            logger.info(f"🔍 Searching {platform_name} with resume matching...")
-            
-            # Job templates with detailed requirements
-            job_templates = {
-                'X/Twitter': [
-                    {
-                        'title': 'Senior DevOps Engineer',
-                        'company': 'X (Twitter)',
-                        'salary': '$120,000 - $180,000',
-                        'requirements': 'Python, AWS, Docker, Kubernetes, Jenkins, 5+ years experience',
-                        'experience_required': '5+ years'
-                    },
-                    {
-                        'title': 'DevOps Platform Engineer',
-                        'company': 'X (Twitter)',
-                        'salary': '$110,000 - $160,000',
-                        'requirements': 'DevOps, CI/CD, GitLab, Docker, 3+ years experience',
-                        'experience_required': '3+ years'
-                    },
-                    {
-                        'title': 'DevOps Architect',
-                        'company': 'X (Twitter)',
-                        'salary': '$140,000 - $200,000',
-                        'requirements': 'AWS, Kubernetes, Terraform, Architecture, 7+ years experience',
-                        'experience_required': '7+ years'
-                    },
-                    {
-                        'title': 'Site Reliability Engineer',
-                        'company': 'X (Twitter)',
-                        'salary': '$115,000 - $170,000',
-                        'requirements': 'Python, Linux, Monitoring, SRE practices, 4+ years experience',
-                        'experience_required': '4+ years'
-                    },
-                    {
-                        'title': 'Cloud Infrastructure Engineer',
-                        'company': 'X (Twitter)',
-                        'salary': '$105,000 - $155,000',
-                        'requirements': 'AWS, Cloud infrastructure, Python, 3+ years experience',
-                        'experience_required': '3+ years'
-                    }
-                ],
-                'DICE': [
-                    {
-                        'title': 'DevOps Engineer',
-                        'company': 'TechCorp',
-                        'salary': '$75,000 - $110,000',
-                        'requirements': 'DevOps, CI/CD, Docker, AWS, 2+ years experience',
-                        'experience_required': '2+ years'
-                    },
-                    {
-                        'title': 'Cloud Engineer',
-                        'company': 'CloudCorp',
-                        'salary': '$80,000 - $120,000',
-                        'requirements': 'AWS, Cloud services, Python, 3+ years experience',
-                        'experience_required': '3+ years'
-                    },
-                    {
-                        'title': 'Platform Engineer',
-                        'company': 'PlatformCorp',
-                        'salary': '$85,000 - $125,000',
-                        'requirements': 'Kubernetes, Docker, Platform engineering, 3+ years experience',
-                        'experience_required': '3+ years'
-                    }
-                ],
-                'Indeed': [
-                    {
-                        'title': 'Remote DevOps Engineer',
-                        'company': 'RemoteCorp',
-                        'salary': '$65,000 - $100,000',
-                        'requirements': 'DevOps, Remote work, CI/CD, 2+ years experience',
-                        'experience_required': '2+ years'
-                    },
-                    {
-                        'title': 'Cloud Infrastructure Engineer',
-                        'company': 'CloudFirst',
-                        'salary': '$70,000 - $110,000',
-                        'requirements': 'Cloud infrastructure, AWS, DevOps, 3+ years experience',
-                        'experience_required': '3+ years'
-                    }
-                ],
-                'WeWorkRemotely': [
-                    {
-                        'title': 'Remote DevOps Engineer',
-                        'company': 'GlobalTech',
-                        'salary': '$70,000 - $110,000',
-                        'requirements': 'DevOps, Remote collaboration, CI/CD, 2+ years experience',
-                        'experience_required': '2+ years'
-                    }
-                ],
-                'Turing': [
-                    {
-                        'title': 'DevOps Engineer - Remote',
-                        'company': 'US Tech Company',
-                        'salary': '$60,000 - $90,000',
-                        'requirements': 'DevOps, Python, AWS, Remote work, 2+ years experience',
-                        'experience_required': '2+ years'
-                    }
-                ]
-            }
+            logger.info("🔍 Searching %s with resume matching...", platform_name)
             
-            templates = job_templates.get(platform_name, [])
             matching_jobs = []
+            min_match = self.config['preferences'].get('min_match_percentage', 60.0)
+            min_salary = self.config['preferences'].get('salary_min', 45000)
             
-            for i, job_data in enumerate(templates):
+            for job_id, job_data, (salary_min, salary_max, salary_display) in _TEMPLATE_JOBS.get(platform_name, []):
                 try:
-                    job_id = f"{platform_name.lower().replace('/', '_')}_{i+1:03d}"
-                    
                     if job_id not in self.applied_jobs:
-                        salary_min, salary_max, salary_display = self._extract_salary(job_data.get('salary', ''))
+                        if salary_min != 0 and salary_min < min_salary:
+                            continue
                         
                         job_match = JobMatch(
                             platform=platform_name,
@@ -999,28 +1305,23 @@ class EnhancedResumeMatchingBot:
                         )
                         
                         # Calculate resume matching
-                        job_match = self.resume_analyzer.calculate_job_match(job_match, self.resume_profile)
-                        
-                        # Check minimum match and salary requirements
-                        min_match = self.config['preferences'].get('min_match_percentage', 60.0)
-                        min_salary = self.config['preferences'].get('salary_min', 45000)
+                        if not self._restore_cached_match(job_match):
+                            job_match = self.resume_analyzer.calculate_job_match(job_match, self.resume_profile)
+                            self._remember_match(job_match)
                         
-                        if (job_match.overall_match_percentage >= min_match and 
-                            (salary_min == 0 or salary_min >= min_salary)):
+                        # Check minimum match requirement
+                        if job_match.overall_match_percentage >= min_match:
                             matching_jobs.append(job_match)
                         
                 except Exception as e:
-                    logger.error(f"Error processing {platform_name} template job: {e}")
+                    logger.error("Error processing %s template job: %s", platform_name, e)
                     continue
             
-            # Sort by match percentage
-            matching_jobs.sort(key=lambda x: x.overall_match_percentage, reverse=True)
-            
-            logger.info(f"✅ Found {len(matching_jobs)} {platform_name} jobs with good resume match")
+            logger.info("✅ Found %s %s jobs with good resume match", len(matching_jobs), platform_name)
             return matching_jobs
             
         except Exception as e:
-            logger.error(f"❌ {platform_name} template search failed: {e}")
+            logger.error("❌ %s template search failed: %s", platform_name, e)
             return []
     
     def get_all_jobs(self):
@@ -1030,39 +1331,44 @@ class EnhancedResumeMatchingBot:
             all_jobs = []
             platform_stats = {}
             
-            for platform_name, config in self.platforms.items():
-                if not config['enabled']:
-                    continue
-                
+            # Searches are IO-bound, so run them concurrently and collect in platform order
+            enabled = [(name, config) for name, config in self.platforms.items() if config['enabled']]
+            with ThreadPoolExecutor(max_workers=max(len(enabled), 1)) as executor:
+                futures = {
+                    platform_name: executor.submit(self.search_remoteok_jobs)
+                    if platform_name == 'RemoteOK' and not config.get('template')
+                    else executor.submit(self.search_platform_template_jobs, platform_name)
+                    for platform_name, config in enabled
+                }
+            
+            for platform_name, future in futures.items():
                 try:
-                    if platform_name == 'RemoteOK' and not config.get('template'):
-                        jobs = self.search_remoteok_jobs()
-                    else:
-                        jobs = self.search_platform_template_jobs(platform_name)
+                    jobs = future.result()
                     
                     platform_stats[platform_name] = len(jobs)
                     all_jobs.extend(jobs)
                     
                 except Exception as e:
-                    logger.error(f"❌ {platform_name} search failed: {e}")
+                    logger.error("❌ %s search failed: %s", platform_name, e)
                     platform_stats[platform_name] = 0
             
-            # Sort by overall match percentage (highest first)
-            all_jobs.sort(key=lambda x: x.overall_match_percentage, reverse=True)
+            # Sort by overall match percentage (highest first); platforms return unsorted
+            # lists since this one stable sort yields the same order
+            all_jobs.sort(key=attrgetter('overall_match_percentage'), reverse=True)
             
             # Log platform statistics with match info
-            logger.info(f"📊 PLATFORM SEARCH RESULTS WITH RESUME MATCHING:")
+            logger.info("📊 PLATFORM SEARCH RESULTS WITH RESUME MATCHING:")
             for platform, count in platform_stats.items():
-                logger.info(f"   {platform}: {count} jobs (meeting match criteria)")
+                logger.info("   %s: %s jobs (meeting match criteria)", platform, count)
             
             if all_jobs:
-                logger.info(f"🎯 Top match: {all_jobs[0].title} at {all_jobs[0].company} ({all_jobs[0].overall_match_percentage}% match)")
+                logger.info("🎯 Top match: %s at %s (%s%% match)", all_jobs[0].title, all_jobs[0].company, all_jobs[0].overall_match_percentage)
             
-            logger.info(f"📊 Total matching jobs found: {len(all_jobs)}")
+            logger.info("📊 Total matching jobs found: %s", len(all_jobs))
             return all_jobs
             
         except Exception as e:
-            logger.error(f"❌ Comprehensive job search failed: {e}")
+            logger.error("❌ Comprehensive job search failed: %s", e)
             return []
     
     def take_proof_screenshot(self, job: JobMatch, suffix=""):
@@ -1072,22 +1378,23 @@ class EnhancedResumeMatchingBot:
                 logger.warning("⚠️ No browser available for screenshot")
                 return None
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_title = "".join(c for c in job.title if c.isalnum() or c in (' ', '-', '_')).strip()[:50]
-            safe_company = "".join(c for c in job.company if c.isalnum() or c in (' ', '-', '_')).strip()[:30]
-            safe_platform = "".join(c for c in job.platform if c.isalnum() or c in (' ', '-', '_')).strip()
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            safe_title = job.title.translate(_FILENAME_CHARS).strip()[:50]
+            safe_company = job.company.translate(_FILENAME_CHARS).strip()[:30]
+            safe_platform = job.platform.translate(_FILENAME_CHARS).strip()
             
-            filename = f"{self.proof_folder}/resume_match_{safe_platform}_{safe_company}_{safe_title}"
+            basename = f"resume_match_{safe_platform}_{safe_company}_{safe_title}"
             if suffix:
-                filename += f"_{suffix}"
-            filename += f"_{timestamp}.png"
+                basename += f"_{suffix}"
+            basename += f"_{timestamp}.png"
             
-            filename = filename.replace(" ", "_").replace("/", "_").replace("\\", "_")
-            filename = filename[:200]
+            # Only the file name is sanitized, so the screenshot lands inside proof_folder
+            basename = basename.translate(_FILENAME_SEPARATORS)[:200 - len(self._proof_prefix)]
+            filename = self._proof_prefix + basename
             
             self.driver.save_screenshot(filename)
             self.screenshot_count += 1
-            logger.info(f"📸 Screenshot #{self.screenshot_count} saved: {os.path.basename(filename)}")
+            logger.info(f"📸 Screenshot #{self.screenshot_count} saved: {basename}")
             
             return filename
             
@@ -1098,13 +1405,13 @@ class EnhancedResumeMatchingBot:
     def apply_to_job(self, job: JobMatch):
         """Enhanced job application with resume matching info"""
         try:
-            logger.info(f"📝 APPLYING TO: {job.title} at {job.company} ({job.platform})")
-            logger.info(f"🎯 RESUME MATCH: {job.overall_match_percentage}% overall")
-            logger.info(f"   Skills Match: {job.skills_match_percentage}%")
-            logger.info(f"   Tech Match: {job.technology_match_percentage}%")
-            logger.info(f"   Experience Match: {job.experience_match_percentage}%")
+            logger.info("📝 APPLYING TO: %s at %s (%s)", job.title, job.company, job.platform)
+            logger.info("🎯 RESUME MATCH: %s%% overall", job.overall_match_percentage)
+            logger.info("   Skills Match: %s%%", job.skills_match_percentage)
+            logger.info("   Tech Match: %s%%", job.technology_match_percentage)
+            logger.info("   Experience Match: %s%%", job.experience_match_percentage)
             if job.salary:
-                logger.info(f"💰 Salary: {job.salary}")
+                logger.info("💰 Salary: %s", job.salary)
             
             # Mark as applied
             self.applied_jobs.add(job.id)
@@ -1117,68 +1424,68 @@ class EnhancedResumeMatchingBot:
                     time.sleep(3)
                     screenshot_file = self.take_proof_screenshot(job)
                 except Exception as e:
-                    logger.warning(f"⚠️ Browser navigation failed: {e}")
+                    logger.warning("⚠️ Browser navigation failed: %s", e)
             
             # Enhanced application logging with resume matching details
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            log_entry = f"""{timestamp} - APPLIED WITH RESUME MATCHING
-Platform: {job.platform}
-Title: {job.title}
-Company: {job.company}
-Salary: {job.salary or 'Not specified'}
-Location: {job.location or 'Not specified'}
-URL: {job.url}
-
-RESUME MATCHING ANALYSIS:
-Overall Match: {job.overall_match_percentage}%
-Skills Match: {job.skills_match_percentage}%
-Technology Match: {job.technology_match_percentage}%
-Experience Match: {job.experience_match_percentage}%
-Education Match: {job.education_match_percentage}%
-
-Matched Skills: {', '.join(job.matched_skills) if job.matched_skills else 'N/A'}
-Missing Skills: {', '.join(job.missing_skills) if job.missing_skills else 'None'}
-Matched Technologies: {', '.join(job.matched_technologies) if job.matched_technologies else 'N/A'}
-Missing Technologies: {', '.join(job.missing_technologies) if job.missing_technologies else 'None'}
-
-Job Requirements: {job.requirements[:200]}...
-Experience Required: {job.experience_required or 'Not specified'}
-
-Proof: {screenshot_file or 'API-only'}
----
-
-"""
+            log_entry = _APPLICATION_LOG_TEMPLATE.format(
+                timestamp=timestamp,
+                job=job,
+                salary=job.salary or 'Not specified',
+                location=job.location or 'Not specified',
+                matched_skills=', '.join(job.matched_skills) or 'N/A',
+                missing_skills=', '.join(job.missing_skills) or 'None',
+                matched_technologies=', '.join(job.matched_technologies) or 'N/A',
+                missing_technologies=', '.join(job.missing_technologies) or 'None',
+                requirements=job.requirements[:200],
+                experience_required=job.experience_required or 'Not specified',
+                proof=screenshot_file or 'API-only'
+            )
             
             try:
-                with open(self.applications_file, 'a', encoding='utf-8') as f:
-                    f.write(log_entry)
+                self._write_application_log(log_entry)
             except Exception as e:
-                logger.error(f"❌ Application logging failed: {e}")
+                logger.error("❌ Application logging failed: %s", e)
             
             self.applications_sent += 1
-            logger.info(f"✅ Application #{self.applications_sent} completed with {job.overall_match_percentage}% match!")
+            logger.info("✅ Application #%s completed with %s%% match!", self.applications_sent, job.overall_match_percentage)
             return True
             
         except Exception as e:
-            logger.error(f"❌ Application failed: {e}")
+            logger.error("❌ Application failed: %s", e)
             return False
     
+    def _write_application_log(self, entry: str):
+        """Append to the applications file through one buffered handle per cycle"""
+        if self._applications_log is None:
+            self._applications_log = open(self.applications_file, 'a', encoding='utf-8', buffering=1 << 16)
+        self._applications_log.write(entry)
+    
+    def _close_application_log(self):
+        """Flush and close the applications file"""
+        if self._applications_log is not None:
+            try:
+                self._applications_log.close()
+            except Exception as e:
+                logger.error(f"❌ Application logging failed: {e}")
+            self._applications_log = None
+    
     def run_enhanced_resume_matching_cycle(self):
         """Run enhanced job application cycle with resume matching"""
         try:
             logger.info("🚀 STARTING ENHANCED RESUME MATCHING BOT CYCLE")
-            logger.info(f"⏰ Run Time: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')} UTC")
-            logger.info(f"🎯 Target Applications: {self.target_applications[0]} to {self.target_applications[1]}")
-            logger.info(f"💰 Minimum Salary: ${self.config['preferences']['salary_min']:,}")
-            logger.info(f"🎯 Minimum Resume Match: {self.config['preferences']['min_match_percentage']}%")
+            logger.info("⏰ Run Time: %s UTC", self.start_time.strftime('%Y-%m-%d %H:%M:%S'))
+            logger.info("🎯 Target Applications: %s to %s", self.target_applications[0], self.target_applications[1])
+            logger.info("💰 Minimum Salary: $%s", format(self.config['preferences']['salary_min'], ','))
+            logger.info("🎯 Minimum Resume Match: %s%%", self.config['preferences']['min_match_percentage'])
             
             # Display resume profile summary
-            logger.info(f"📄 RESUME PROFILE SUMMARY:")
-            logger.info(f"   Skills: {len(self.resume_profile.skills)} detected")
-            logger.info(f"   Experience: {self.resume_profile.experience_years} years")
-            logger.info(f"   Education: {len(self.resume_profile.education)} entries")
-            logger.info(f"   Certifications: {len(self.resume_profile.certifications)} found")
-            logger.info(f"   Top Skills: {', '.join(self.resume_profile.skills[:5])}")
+            logger.info("📄 RESUME PROFILE SUMMARY:")
+            logger.info("   Skills: %s detected", len(self.resume_profile.skills))
+            logger.info("   Experience: %s years", self.resume_profile.experience_years)
+            logger.info("   Education: %s entries", len(self.resume_profile.education))
+            logger.info("   Certifications: %s found", len(self.resume_profile.certifications))
+            logger.info("   Top Skills: %s", ', '.join(self.resume_profile.skills[:5]))
             
             # Setup browser
             browser_available = self.setup_browser()
@@ -1190,38 +1497,43 @@ Proof: {screenshot_file or 'API-only'}
             # Platform search
             logger.info("🔍 Platforms to Search with Resume Matching:")
             for platform in self.platforms.keys():
-                logger.info(f"   ✓ {platform}")
+                logger.info("   ✓ %s", platform)
             
             # Get all available jobs with matching
             all_jobs = self.get_all_jobs()
+            self._save_match_cache()
             
             if not all_jobs:
                 logger.warning("⚠️ No jobs found meeting resume match criteria")
                 return self._generate_final_report()
             
             # Application process
-            logger.info(f"🎯 Starting application process with resume matching...")
+            logger.info("🎯 Starting application process with resume matching...")
             max_applications = self.target_applications[1]
             
             successful_applications = []
             
             for job in all_jobs:
                 if self.applications_sent >= max_applications:
-                    logger.info(f"ℹ️ Reached maximum application limit ({max_applications})")
+                    logger.info("ℹ️ Reached maximum application limit (%s)", max_applications)
                     break
                 
                 try:
+                    # apply_to_job only touches the network when it opens the job page
+                    visits_site = bool(self.driver and job.url)
                     if self.apply_to_job(job):
                         successful_applications.append(job)
                         
-                        # Random delay
-                        delay = random.uniform(3, 8)
-                        time.sleep(delay)
+                        # Random delay between site visits; log-only applications need none
+                        if visits_site:
+                            delay = random.uniform(3, 8)
+                            time.sleep(delay)
                         
                 except Exception as e:
-                    logger.error(f"❌ Failed to apply to {job.title}: {e}")
+                    logger.error("❌ Failed to apply to %s: %s", job.title, e)
             
             # Cleanup
+            self._close_application_log()
             if self.driver:
                 try:
                     self.driver.quit()
@@ -1233,10 +1545,11 @@ Proof: {screenshot_file or 'API-only'}
             return self._generate_final_report(successful_applications, [], all_jobs)
             
         except Exception as e:
-            logger.error(f"❌ Enhanced resume matching cycle failed: {e}")
+            logger.error("❌ Enhanced resume matching cycle failed: %s", e)
             logger.error(traceback.format_exc())
             return False
         finally:
+            self._close_application_log()
             if self.driver:
                 try:
                     self.driver.quit()
@@ -1256,11 +1569,12 @@ Proof: {screenshot_file or 'API-only'}
             if all_jobs is None:
                 all_jobs = []
             
-            # Calculate match statistics
-            if successful_applications:
-                avg_match = sum(job.overall_match_percentage for job in successful_applications) / len(successful_applications)
-                highest_match = max(job.overall_match_percentage for job in successful_applications)
-                lowest_match = min(job.overall_match_percentage for job in successful_applications)
+            # Calculate match statistics (read scores off the jobs once, reduce in C)
+            match_scores = [job.overall_match_percentage for job in successful_applications]
+            if match_scores:
+                avg_match = sum(match_scores) / len(match_scores)
+                highest_match = max(match_scores)
+                lowest_match = min(match_scores)
             else:
                 avg_match = 0
                 highest_match = 0
@@ -11,8 +11,11 @@ import time
 import random
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pickle
 import hashlib
+import importlib.util
 import smtplib
 import sqlite3
 from datetime import datetime, timedelta
@@ -35,6 +38,9 @@ except ImportError:
 
 import threading
 from dataclasses import dataclass
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 import re
 import traceback
@@ -49,6 +55,7 @@ from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import *
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.firefox import GeckoDriverManager
 from bs4 import BeautifulSoup
 # Configure comprehensive logging first
@@ -78,35 +85,30 @@ except ImportError:
     ADVANCED_SCORING_AVAILABLE = False
     logger.warning("Advanced scoring system not available, using basic scoring")
 
-# NLP and ML libraries
-try:
-    import nltk
-    from nltk.corpus import stopwords
-    from nltk.tokenize import word_tokenize
-    from nltk.stem import WordNetLemmatizer
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
-    import pandas as pd
-    import numpy as np
-    NLP_AVAILABLE = True
+# NLP and ML libraries are heavy to import, so only probe for them here and
+# import them where they are used
+NLP_AVAILABLE = all(importlib.util.find_spec(name) is not None
+                    for name in ('nltk', 'sklearn', 'pandas', 'numpy'))
+if NLP_AVAILABLE:
     print("SUCCESS: NLP libraries loaded successfully")
-except ImportError:
-    NLP_AVAILABLE = False
+else:
     print("WARNING: NLP libraries not available. Using basic scoring only.")
 
 # Optional spacy for advanced NLP
-try:
-    import spacy
-    SPACY_AVAILABLE = True
-except ImportError:
-    SPACY_AVAILABLE = False
+SPACY_AVAILABLE = importlib.util.find_spec('spacy') is not None
 
 # Optional textblob for sentiment analysis
-try:
-    from textblob import TextBlob
-    TEXTBLOB_AVAILABLE = True
-except ImportError:
-    TEXTBLOB_AVAILABLE = False
+TEXTBLOB_AVAILABLE = importlib.util.find_spec('textblob') is not None
+
+@lru_cache(maxsize=1)
+def _load_spacy_model():
+    """Load the spaCy English model on first use, or None if unavailable"""
+    try:
+        import spacy
+        return spacy.load("en_core_web_sm")
+    except Exception:
+        logger.warning("Spacy model not available")
+        return None
 
 # PDF processing
 try:
@@ -116,9 +118,117 @@ try:
 except ImportError:
     PDF_AVAILABLE = False
 
+# Native PDFium text extraction, preferred over pure-Python PyPDF2 when installed
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
+# Fast JSON decoding for API responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Fast non-cryptographic hashing for job IDs
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Linear-time regex engine for scanning untrusted resume text
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Multi-pattern keyword scanning
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+def _build_automaton(keywords) -> Optional["ahocorasick.Automaton"]:
+    """Aho-Corasick automaton reporting every keyword that occurs as a substring"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        if keyword:
+            automaton.add_word(keyword, keyword)
+    if len(automaton) == 0:
+        return None
+    automaton.make_automaton()
+    return automaton
+
+def _find_keywords(automaton, text_lower: str) -> set:
+    """Keywords of an automaton found in text, in one pass"""
+    if automaton is None:
+        return set()
+    return {keyword for _, keyword in automaton.iter(text_lower)}
+
+@lru_cache(maxsize=8)
+def _skill_matcher(skills: Tuple[str, ...]) -> Tuple[Optional["ahocorasick.Automaton"], Counter]:
+    """Automaton over a user's skills plus how often each lowercased skill is listed"""
+    skills_lower = [skill.lower() for skill in skills]
+    return _build_automaton(set(skills_lower)), Counter(skills_lower)
+
+# Job description sentiment indicators and their score adjustments
+_SENTIMENT_WEIGHTS = {
+    # Scam indicators
+    'make money fast': -10, 'work from home guaranteed': -10, 'no experience required': -10,
+    'earn $1000+ daily': -10, 'investment opportunity': -10, 'pyramid': -10, 'mlm': -10,
+    'too good to be true': -10, 'limited time offer': -10, 'act now': -10,
+    # Positive indicators
+    'career growth': 5, 'professional development': 5, 'competitive salary': 5,
+    'benefits': 5, 'training': 5, 'mentorship': 5, 'team collaboration': 5,
+}
+_SENTIMENT_AUTOMATON = _build_automaton(_SENTIMENT_WEIGHTS) if AHOCORASICK_AVAILABLE else None
+
+def _stable_job_id(job_data: Dict) -> int:
+    """Process-independent ID for a job posting that has no id of its own"""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(job_data, option=orjson.OPT_SORT_KEYS, default=str)
+    else:
+        payload = json.dumps(job_data, sort_keys=True, separators=(',', ':'),
+                             ensure_ascii=False, default=str).encode()
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh64_intdigest(payload)
+    return int.from_bytes(hashlib.blake2b(payload, digest_size=8).digest(), 'big')
+
+# Concurrent HTTP requests when fetching job descriptions
+DESCRIPTION_FETCH_WORKERS = 8
+
+# Retry policy for the scraper's HTTP session
+HTTP_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+HTTP_RETRY_AFTER_MAX = 30  # seconds; longer Retry-After values are cut to this
+
+class _JitteredRetry(Retry):
+    """urllib3 Retry with "full jitter" backoff and a capped, jittered Retry-After"""
+    
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return random.uniform(0, backoff) if backoff else 0
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if not retry_after:
+            return retry_after
+        # Up to 25% extra so clients told the same Retry-After don't return in lockstep
+        retry_after = min(retry_after, HTTP_RETRY_AFTER_MAX)
+        return retry_after + random.uniform(0, 0.25 * retry_after)
+
 # Logger is already configured above
 
-@dataclass
+# __slots__ dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class JobMatch:
     """Job match data structure"""
     title: str
@@ -135,7 +245,7 @@ class JobMatch:
     id: str
     apply_url: Optional[str] = None
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class UserProfile:
     """User profile data structure"""
     name: str
@@ -151,16 +261,31 @@ class UserProfile:
     remote_only: bool
     certifications: List[str]
 
+# WAL lets readers run alongside the writer; NORMAL sync is durable enough under WAL
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-20000",
+)
+
 class DatabaseManager:
     """SQLite database manager for job applications and analytics"""
     
     def __init__(self, db_path="job_bot.db"):
         self.db_path = db_path
+        # One long-lived connection; check_same_thread=False lets worker threads share it
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        cursor = self._conn.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
         self.init_database()
     
     def init_database(self):
         """Initialize database tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
         
         # Applications table
@@ -207,30 +332,81 @@ class DatabaseManager:
             )
         ''')
         
+        # Jobs claimed for application, recorded before the application row is written
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS applied_jobs (
+                job_id TEXT PRIMARY KEY
+            )
+        ''')
+        
         conn.commit()
-        conn.close()
+    
+    @staticmethod
+    def application_row(job_match: JobMatch, screenshot_path: str, cover_letter: str) -> Tuple:
+        """Build an applications row, stamped with the time of the application"""
+        return (
+            job_match.id, job_match.title, job_match.company, job_match.platform,
+            job_match.url, datetime.now(), job_match.relevance_score,
+            screenshot_path, cover_letter
+        )
     
     def save_application(self, job_match: JobMatch, screenshot_path: str, cover_letter: str):
         """Save application to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self.save_applications_bulk([self.application_row(job_match, screenshot_path, cover_letter)])
+    
+    def save_applications_bulk(self, rows: List[Tuple]):
+        """Save many application rows in a single transaction"""
+        if not rows:
+            return
         
         try:
-            cursor.execute('''
-                INSERT OR REPLACE INTO applications 
-                (job_id, title, company, platform, url, applied_date, relevance_score, 
-                 screenshot_path, cover_letter)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                job_match.id, job_match.title, job_match.company, job_match.platform,
-                job_match.url, datetime.now(), job_match.relevance_score,
-                screenshot_path, cover_letter
-            ))
-            conn.commit()
+            with self._conn:
+                self._conn.executemany('''
+                    INSERT OR REPLACE INTO applications 
+                    (job_id, title, company, platform, url, applied_date, relevance_score, 
+                     screenshot_path, cover_letter)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', rows)
         except Exception as e:
             logger.error(f"Database save error: {e}")
-        finally:
-            conn.close()
+    
+    def record_applied_id(self, job_id: str):
+        """Durably mark a job as applied to"""
+        try:
+            with self._conn:
+                self._conn.execute('INSERT OR IGNORE INTO applied_jobs (job_id) VALUES (?)', (job_id,))
+        except Exception as e:
+            logger.error(f"Database save error: {e}")
+    
+    def load_applied_ids(self) -> set:
+        """Job IDs of every application recorded in the database"""
+        try:
+            return {row[0] for row in self._conn.execute(
+                'SELECT job_id FROM applications UNION SELECT job_id FROM applied_jobs')}
+        except Exception as e:
+            logger.error(f"Database read error: {e}")
+            return set()
+    
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()
+
+# Resume parsing patterns, compiled once
+_SKILL_CATEGORY_RES = (
+    re.compile(r'\b(python|java|javascript|c\+\+|c#|ruby|go|rust|php)\b', re.IGNORECASE),      # programming
+    re.compile(r'\b(react|angular|vue|django|flask|spring|express)\b', re.IGNORECASE),          # frameworks
+    re.compile(r'\b(aws|azure|gcp|cloud|ec2|s3|lambda)\b', re.IGNORECASE),                      # cloud
+    re.compile(r'\b(sql|mysql|postgresql|mongodb|redis|elasticsearch)\b', re.IGNORECASE),       # databases
+)
+_EXPERIENCE_RES = (
+    re.compile(r'(\d+)\+?\s*years?\s*of\s*experience', re.IGNORECASE),
+    re.compile(r'experience:?\s*(\d+)\+?\s*years?', re.IGNORECASE),
+    re.compile(r'(\d+)\+?\s*years?\s*in', re.IGNORECASE),
+)
+# Contact patterns run over the whole resume; re2 keeps them linear on long dotted runs
+_CONTACT_RE = re2 if RE2_AVAILABLE else re
+_EMAIL_RE = _CONTACT_RE.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = _CONTACT_RE.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
 
 class ResumeParser:
     """Advanced resume parsing with NLP"""
@@ -243,16 +419,28 @@ class ResumeParser:
             'sql', 'mongodb', 'postgresql', 'mysql', 'redis',
             'machine learning', 'ai', 'data science', 'analytics'
         ]
-        
-        if NLP_AVAILABLE:
-            try:
-                self.nlp = spacy.load("en_core_web_sm")
-            except:
-                self.nlp = None
-                logger.warning("Spacy model not available")
+        self._skill_automaton = _build_automaton(self.skills_keywords) if AHOCORASICK_AVAILABLE else None
+    
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded on first use since parsing itself does not need it"""
+        if not NLP_AVAILABLE:
+            return None
+        return _load_spacy_model()
     
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """Extract text from PDF resume"""
+        if PDFIUM_AVAILABLE:
+            try:
+                pdf = pdfium.PdfDocument(pdf_path)
+                try:
+                    return "\n".join(page.get_textpage().get_text_range() for page in pdf)
+                finally:
+                    pdf.close()
+            except Exception as e:
+                logger.error(f"PDF extraction error: {e}")
+                return ""
+        
         if not PDF_AVAILABLE:
             return ""
         
@@ -272,34 +460,23 @@ class ResumeParser:
         text_lower = text.lower()
         found_skills = []
         
-        for skill in self.skills_keywords:
-            if skill in text_lower:
-                found_skills.append(skill.title())
+        if AHOCORASICK_AVAILABLE:
+            found_skills.extend(skill.title() for skill in _find_keywords(self._skill_automaton, text_lower))
+        else:
+            for skill in self.skills_keywords:
+                if skill in text_lower:
+                    found_skills.append(skill.title())
         
         # Additional pattern matching
-        patterns = {
-            'programming': r'\b(python|java|javascript|c\+\+|c#|ruby|go|rust|php)\b',
-            'frameworks': r'\b(react|angular|vue|django|flask|spring|express)\b',
-            'cloud': r'\b(aws|azure|gcp|cloud|ec2|s3|lambda)\b',
-            'databases': r'\b(sql|mysql|postgresql|mongodb|redis|elasticsearch)\b'
-        }
-        
-        for category, pattern in patterns.items():
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            found_skills.extend([match.title() for match in matches])
+        for pattern in _SKILL_CATEGORY_RES:
+            found_skills.extend(match.title() for match in pattern.findall(text_lower))
         
         return list(set(found_skills))
     
     def extract_experience_years(self, text: str) -> int:
         """Extract years of experience from resume"""
-        patterns = [
-            r'(\d+)\+?\s*years?\s*of\s*experience',
-            r'experience:?\s*(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*years?\s*in'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _EXPERIENCE_RES:
+            match = pattern.search(text)
             if match:
                 return int(match.group(1))
         
@@ -323,11 +500,8 @@ class ResumeParser:
         experience_years = self.extract_experience_years(text)
         
         # Extract contact info (basic patterns)
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        phone_pattern = r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
-        
-        emails = re.findall(email_pattern, text)
-        phones = re.findall(phone_pattern, text)
+        emails = _EMAIL_RE.findall(text)
+        phones = _PHONE_RE.findall(text)
         
         return {
             'skills': skills,
@@ -337,11 +511,27 @@ class ResumeParser:
             'full_text': text
         }
 
+# Most basic job scores remembered across cycles
+SCORE_CACHE_SIZE = 5000
+
+# Relevance scoring patterns, compiled once
+_ENGINEERING_TITLE_RE = re.compile(r'engineer|developer|devops|sre|cloud|platform|infrastructure|software')
+_ANYWHERE_LOCATION_RE = re.compile(r'remote|worldwide|global')
+
+@lru_cache(maxsize=8)
+def _role_title_pattern(roles: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Union pattern matching any of a user's lowercased preferred roles as a substring"""
+    if not roles:
+        return None
+    return re.compile('|'.join(re.escape(role.lower()) for role in roles))
+
 class JobRelevanceScorer:
     """ML-based job relevance scoring"""
     
     def __init__(self):
+        self._score_cache = OrderedDict()  # (job id, profile) -> (relevance, sentiment, skill match)
         if NLP_AVAILABLE:
+            from sklearn.feature_extraction.text import TfidfVectorizer
             self.vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
             self.fitted = False
     
@@ -353,18 +543,26 @@ class JobRelevanceScorer:
         job_text = job_requirements.lower()
         matched_skills = 0
         
-        for skill in user_skills:
-            if skill.lower() in job_text:
-                matched_skills += 1
+        if AHOCORASICK_AVAILABLE:
+            # Duplicate skills count once per listing; an empty skill matches any text
+            automaton, skill_counts = _skill_matcher(tuple(user_skills))
+            found = _find_keywords(automaton, job_text)
+            matched_skills = sum(skill_counts[skill] for skill in found) + skill_counts['']
+        else:
+            for skill in user_skills:
+                if skill.lower() in job_text:
+                    matched_skills += 1
         
         return (matched_skills / len(user_skills)) * 100
     
-    def calculate_relevance_score(self, user_profile: UserProfile, job_match: JobMatch) -> float:
+    def calculate_relevance_score(self, user_profile: UserProfile, job_match: JobMatch,
+                                  skill_match: Optional[float] = None) -> float:
         """Calculate comprehensive job relevance score (0-100) - Enhanced for better matching"""
         score = 0.0
         
         # Skill match (35% weight) - More lenient scoring
-        skill_match = self.calculate_skill_match(user_profile.skills, job_match.requirements)
+        if skill_match is None:
+            skill_match = self.calculate_skill_match(user_profile.skills, job_match.requirements)
         # Boost score if any skills match
         if skill_match > 0:
             skill_match = max(skill_match, 20)  # Minimum 20% if any skills match
@@ -375,25 +573,20 @@ class JobRelevanceScorer:
         job_title_lower = job_match.title.lower()
         
         # Check for exact role matches
-        for preferred_role in user_profile.preferred_roles:
-            if preferred_role.lower() in job_title_lower:
-                title_match = 100
-                break
+        role_pattern = _role_title_pattern(tuple(user_profile.preferred_roles))
+        if role_pattern is not None and role_pattern.search(job_title_lower):
+            title_match = 100
         
         # Check for common DevOps/Engineering keywords if no exact match
-        if title_match == 0:
-            devops_keywords = ['engineer', 'developer', 'devops', 'sre', 'cloud', 'platform', 'infrastructure', 'software']
-            for keyword in devops_keywords:
-                if keyword in job_title_lower:
-                    title_match = 60  # Partial match for engineering roles
-                    break
+        elif _ENGINEERING_TITLE_RE.search(job_title_lower):
+            title_match = 60  # Partial match for engineering roles
         
         score += title_match * 0.30
         
         # Location match (20% weight) - More flexible
         location_match = 0
         location_lower = job_match.location.lower()
-        if 'remote' in location_lower or 'worldwide' in location_lower or 'global' in location_lower:
+        if _ANYWHERE_LOCATION_RE.search(location_lower):
             location_match = 100
         elif user_profile.location.lower() in location_lower:
             location_match = 100
@@ -419,35 +612,46 @@ class JobRelevanceScorer:
         
         return max(0, min(100, score))
     
+    def score_batch(self, user_profile: UserProfile, jobs: List[JobMatch]) -> List[float]:
+        """Score relevance, sentiment and skill match for every job in one pass"""
+        # Postings seen in an earlier cycle with the same profile reuse their scores
+        profile_key = (
+            tuple(user_profile.skills), tuple(user_profile.preferred_roles), user_profile.location,
+            tuple(user_profile.preferred_companies), tuple(user_profile.blacklisted_companies)
+        )
+        scores = []
+        for job in jobs:
+            key = (job.id, profile_key)
+            cached = self._score_cache.get(key)
+            if cached is None:
+                skill_match = self.calculate_skill_match(user_profile.skills, job.requirements)
+                cached = (
+                    self.calculate_relevance_score(user_profile, job, skill_match),
+                    self.analyze_job_sentiment(job.description),
+                    skill_match
+                )
+                self._score_cache[key] = cached
+                if len(self._score_cache) > SCORE_CACHE_SIZE:
+                    self._score_cache.popitem(last=False)
+            else:
+                self._score_cache.move_to_end(key)
+            job.relevance_score, job.sentiment_score, job.skill_match_percentage = cached
+            scores.append(job.relevance_score)
+        return scores
+    
     def analyze_job_sentiment(self, job_description: str) -> float:
         """Analyze job description sentiment (scam detection)"""
-        # Scam indicators
-        scam_keywords = [
-            'make money fast', 'work from home guaranteed', 'no experience required',
-            'earn $1000+ daily', 'investment opportunity', 'pyramid', 'mlm',
-            'too good to be true', 'limited time offer', 'act now'
-        ]
-        
-        spam_score = 0
         description_lower = job_description.lower()
         
-        for keyword in scam_keywords:
-            if keyword in description_lower:
-                spam_score += 10
-        
-        # Positive indicators
-        positive_keywords = [
-            'career growth', 'professional development', 'competitive salary',
-            'benefits', 'training', 'mentorship', 'team collaboration'
-        ]
-        
-        positive_score = 0
-        for keyword in positive_keywords:
-            if keyword in description_lower:
-                positive_score += 5
+        # Each indicator counts once, however often it appears
+        if AHOCORASICK_AVAILABLE:
+            found = _find_keywords(_SENTIMENT_AUTOMATON, description_lower)
+        else:
+            found = [keyword for keyword in _SENTIMENT_WEIGHTS if keyword in description_lower]
+        adjustment = sum(_SENTIMENT_WEIGHTS[keyword] for keyword in found)
         
         # Calculate final sentiment score (0-100, higher is better)
-        final_score = max(0, min(100, 50 + positive_score - spam_score))
+        final_score = max(0, min(100, 50 + adjustment))
         return final_score
 
 class SmartScheduler:
@@ -494,10 +698,23 @@ class SmartScheduler:
         next_run = datetime.now() + timedelta(minutes=base_interval)
         
         # Ensure it's during working hours
-        while not self.is_good_time_to_apply():
-            next_run += timedelta(minutes=30)
-        
-        return next_run
+        return self._next_working_moment(next_run)
+    
+    def _next_working_moment(self, moment: datetime) -> datetime:
+        """Earliest time at or after moment that falls within working hours"""
+        start_hour, end_hour = self.working_hours
+        day_start = moment.replace(hour=start_hour, minute=0, second=0, microsecond=0)
+        if moment.hour < start_hour:
+            moment = day_start
+        elif moment.hour > end_hour:
+            moment = day_start + timedelta(days=1)
+        
+        # Skip ahead to Monday morning
+        if self.avoid_weekends and moment.weekday() >= 5:
+            moment = moment.replace(hour=start_hour, minute=0, second=0, microsecond=0)
+            moment += timedelta(days=7 - moment.weekday())
+        
+        return moment
 
 class NotificationSystem:
     """Email and alert notification system"""
@@ -593,6 +810,19 @@ class EnhancedJobScraper:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        # Keep-alive pool sized for the concurrent description fetches, with retries on transient errors
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=_JitteredRetry(
+                total=HTTP_RETRIES,
+                backoff_factor=HTTP_BACKOFF_FACTOR,
+                status_forcelist=HTTP_RETRY_STATUSES,
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
         # Hierarchical job preferences based on experience level
         self.hierarchical_job_titles = [
@@ -635,7 +865,10 @@ class EnhancedJobScraper:
             response = self.session.get(url, timeout=20)
             
             if response.status_code == 200:
-                data = response.json()[1:]  # Skip first item
+                data = (orjson.loads(response.content) if ORJSON_AVAILABLE else response.json())[1:]  # Skip first item
+                if AHOCORASICK_AVAILABLE:
+                    skill_automaton, skill_counts = _skill_matcher(tuple(self.user_profile.skills))
+                role_pattern = _role_title_pattern(tuple(self.user_profile.preferred_roles))
                 
                 for job_data in data[:50]:
                     title = job_data.get('position', '')
@@ -647,11 +880,14 @@ class EnhancedJobScraper:
                         continue
                     
                     # Check skill match
-                    skill_match = any(skill.lower() in description.lower() 
-                                    for skill in self.user_profile.skills)
+                    if AHOCORASICK_AVAILABLE:
+                        skill_match = ('' in skill_counts or (skill_automaton is not None and
+                                       next(skill_automaton.iter(description.lower()), None) is not None))
+                    else:
+                        skill_match = any(skill.lower() in description.lower() 
+                                        for skill in self.user_profile.skills)
                     
-                    if skill_match or any(role.lower() in title.lower() 
-                                        for role in self.user_profile.preferred_roles):
+                    if skill_match or (role_pattern is not None and role_pattern.search(title.lower())):
                         job_match = JobMatch(
                             title=title,
                             company=company,
@@ -664,7 +900,7 @@ class EnhancedJobScraper:
                             relevance_score=0,
                             sentiment_score=0,
                             skill_match_percentage=0,
-                            id=f"remoteok_{job_data.get('id', hash(str(job_data)))}"
+                            id=f"remoteok_{job_data['id'] if 'id' in job_data else _stable_job_id(job_data)}"
                         )
                         jobs.append(job_match)
                         
@@ -673,71 +909,122 @@ class EnhancedJobScraper:
         
         return jobs
     
-    def search_dice(self, driver) -> List[JobMatch]:
-        """Search Dice.com with Selenium"""
+    def search_dice(self, get_driver) -> List[JobMatch]:
+        """Search Dice.com over plain HTTP, calling get_driver for a browser only if the page needs rendering"""
         jobs = []
         try:
             search_terms = " OR ".join(self.user_profile.preferred_roles)
             url = f"https://www.dice.com/jobs?q={search_terms}&location=Remote"
             
-            driver.get(url)
-            time.sleep(3)
+            # Only render the page in the browser when the served HTML has no job cards
+            listings = self._dice_listings_http(url)
+            if listings is None:
+                driver = get_driver()
+                if driver is None:
+                    return jobs
+                listings = self._dice_listings_selenium(driver, url)
             
-            job_cards = driver.find_elements(By.CSS_SELECTOR, "[data-cy='card']")
+            # Fetch job descriptions concurrently instead of clicking through each card
+            with ThreadPoolExecutor(max_workers=DESCRIPTION_FETCH_WORKERS) as executor:
+                descriptions = list(executor.map(self._fetch_dice_description,
+                                                 [url for _, url, _, _ in listings]))
             
-            for card in job_cards[:20]:
-                try:
-                    title_elem = card.find_element(By.CSS_SELECTOR, "[data-cy='card-title'] a")
-                    title = title_elem.text
-                    url = title_elem.get_attribute('href')
-                    
-                    company_elem = card.find_element(By.CSS_SELECTOR, "[data-cy='card-company']")
-                    company = company_elem.text
-                    
-                    # Skip blacklisted companies
-                    if company in self.user_profile.blacklisted_companies:
-                        continue
-                    
-                    location_elem = card.find_element(By.CSS_SELECTOR, "[data-cy='card-location']")
-                    location = location_elem.text
-                    
-                    # Get job description by clicking
-                    description = ""
-                    try:
-                        title_elem.click()
-                        time.sleep(2)
-                        desc_elem = driver.find_element(By.CSS_SELECTOR, ".job-description")
-                        description = desc_elem.text
-                        driver.back()
-                        time.sleep(2)
-                    except:
-                        pass
-                    
-                    job_match = JobMatch(
-                        title=title,
-                        company=company,
-                        platform="Dice",
-                        url=url,
-                        description=description,
-                        requirements=description,
-                        salary="",
-                        location=location,
-                        relevance_score=0,
-                        sentiment_score=0,
-                        skill_match_percentage=0,
-                        id=f"dice_{hashlib.md5(url.encode()).hexdigest()[:8]}"
-                    )
-                    jobs.append(job_match)
-                    
-                except Exception as e:
-                    logger.error(f"Dice job parsing error: {e}")
-                    continue
+            for (title, url, company, location), description in zip(listings, descriptions):
+                job_match = JobMatch(
+                    title=title,
+                    company=company,
+                    platform="Dice",
+                    url=url,
+                    description=description,
+                    requirements=description,
+                    salary="",
+                    location=location,
+                    relevance_score=0,
+                    sentiment_score=0,
+                    skill_match_percentage=0,
+                    id=f"dice_{hashlib.md5(url.encode()).hexdigest()[:8]}"
+                )
+                jobs.append(job_match)
                     
         except Exception as e:
             logger.error(f"Dice search error: {e}")
         
         return jobs
     
+    def _dice_listings_http(self, url: str) -> Optional[List[Tuple[str, str, str, str]]]:
+        """(title, url, company, location) per Dice result card, or None if the page has no cards"""
+        try:
+            response = self.session.get(url, timeout=20)
+            if response.status_code != 200:
+                return None
+            job_cards = BeautifulSoup(response.text, 'html.parser').select("[data-cy='card']")
+        except Exception as e:
+            logger.warning(f"Dice HTTP search failed, falling back to browser: {e}")
+            return None
+        if not job_cards:
+            return None
+        
+        listings = []
+        for card in job_cards[:20]:
+            title_elem = card.select_one("[data-cy='card-title'] a")
+            company_elem = card.select_one("[data-cy='card-company']")
+            location_elem = card.select_one("[data-cy='card-location']")
+            if title_elem is None or company_elem is None or location_elem is None:
+                logger.error("Dice job parsing error: incomplete job card")
+                continue
+            
+            company = company_elem.get_text(strip=True)
+            
+            # Skip blacklisted companies
+            if company in self.user_profile.blacklisted_companies:
+                continue
+            
+            listings.append((title_elem.get_text(strip=True), urljoin(url, title_elem.get('href', '')),
+                             company, location_elem.get_text(strip=True)))
+        return listings
+    
+    def _dice_listings_selenium(self, driver, url: str) -> List[Tuple[str, str, str, str]]:
+        """(title, url, company, location) per Dice result card, rendered in the browser"""
+        driver.get(url)
+        time.sleep(3)
+        
+        job_cards = driver.find_elements(By.CSS_SELECTOR, "[data-cy='card']")
+        
+        # Read every card before fetching descriptions, so the result page stays loaded
+        listings = []
+        for card in job_cards[:20]:
+            try:
+                title_elem = card.find_element(By.CSS_SELECTOR, "[data-cy='card-title'] a")
+                title = title_elem.text
+                url = title_elem.get_attribute('href')
+                
+                company_elem = card.find_element(By.CSS_SELECTOR, "[data-cy='card-company']")
+                company = company_elem.text
+                
+                # Skip blacklisted companies
+                if company in self.user_profile.blacklisted_companies:
+                    continue
+                
+                location_elem = card.find_element(By.CSS_SELECTOR, "[data-cy='card-location']")
+                location = location_elem.text
+                listings.append((title, url, company, location))
+                
+            except Exception as e:
+                logger.error(f"Dice job parsing error: {e}")
+                continue
+        return listings
+    
+    def _fetch_dice_description(self, url: str) -> str:
+        """Fetch a Dice job page and return its description text, or '' on failure"""
+        try:
+            response = self.session.get(url, timeout=15)
+            if response.status_code != 200:
+                return ""
+            desc_elem = BeautifulSoup(response.text, 'html.parser').select_one('.job-description')
+            return desc_elem.get_text(' ', strip=True) if desc_elem else ""
+        except Exception:
+            return ""
+    
     def search_linkedin(self, driver) -> List[JobMatch]:
         """Search LinkedIn Jobs"""
         jobs = []
@@ -798,6 +1085,127 @@ class EnhancedJobScraper:
         
         return jobs
 
+@lru_cache(maxsize=4)
+def _read_config_file(path: str, mtime: float) -> Dict:
+    """Parsed JSON config file; mtime is part of the cache key so edits are picked up"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+# Runs CSS selectors in order in the page and returns [selector, element] pairs, so
+# checking a whole selector list is one driver round-trip with no implicit wait per miss
+_QUERY_SELECTORS_JS = """
+const [selectors, usableOnly] = arguments;
+const usable = (e) => {
+    if (e.disabled) return false;
+    const style = getComputedStyle(e);
+    return style.visibility !== 'hidden' && style.display !== 'none'
+        && (e.offsetParent !== null || style.position === 'fixed');
+};
+const found = [];
+for (const selector of selectors) {
+    let matches;
+    try { matches = document.querySelectorAll(selector); } catch (e) { continue; }
+    for (const element of matches) {
+        if (!usableOnly || usable(element)) found.push([selector, element]);
+    }
+}
+return found;
+"""
+
+# Set a field's value through the native setter (so framework-controlled
+# inputs see it) and fire the events a typing user would
+_FILL_FIELD_JS = """
+const [element, value] = arguments;
+const proto = element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+Object.getOwnPropertyDescriptor(proto, 'value').set.call(element, value);
+element.dispatchEvent(new Event('input', {bubbles: true}));
+element.dispatchEvent(new Event('change', {bubbles: true}));
+return element.value === value;
+"""
+
+# Cover letter text and the company-specific line it mentions
+_COVER_LETTER_TEMPLATE = """Dear Hiring Manager,
+
+I am writing to express my strong interest in the {job_title} position at {company_name}. With my background in {key_skills} and {experience_years} years of experience in the field, I am excited about the opportunity to contribute to your team's success.
+
+My technical expertise includes:
+{skills_list}
+
+What particularly attracts me to {company_name} is your commitment to innovation and technical excellence. I believe my skills in {relevant_skills} align perfectly with your requirements and would enable me to make meaningful contributions to your projects.
+
+I am especially interested in this role because:
+- The position matches my career goals in {preferred_role}
+- Your company's reputation for {company_strength}
+- The opportunity to work with cutting-edge technologies
+
+I would welcome the opportunity to discuss how my experience and passion for technology can contribute to {company_name}'s continued success. Thank you for considering my application.
+
+Best regards,
+{full_name}
+Email: {email}
+Phone: {phone}
+LinkedIn: {linkedin}
+"""
+
+_COMPANY_STRENGTHS = {
+    'google': 'innovation and global impact',
+    'microsoft': 'enterprise solutions and cloud technology',
+    'amazon': 'scale and customer obsession',
+    'meta': 'social connectivity and VR innovation',
+    'apple': 'design excellence and user experience'
+}
+
+class _FilenameCharTable(dict):
+    """str.translate table that drops characters other than alphanumerics, space, '-' and '_'"""
+    
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        self[codepoint] = codepoint if char.isalnum() or char in ' -_' else None
+        return self[codepoint]
+
+# Screenshot filename tables; the char table fills in lazily as new characters are seen
+_FILENAME_CHARS = _FilenameCharTable()
+_FILENAME_SEPARATORS = str.maketrans({' ': '_', '/': '_', '\\': '_'})
+
+# Apply button selectors, highest priority first
+_APPLY_BUTTON_SELECTORS = (
+    "button[data-control-name='jobdetails_topcard_inapply']",  # LinkedIn
+    "button[aria-label='Apply']",
+    "a[data-cy='apply-button']",  # Dice
+    "button:contains('Apply')",
+    "a:contains('Apply')",
+    "input[value*='Apply']",
+    "button[class*='apply']",
+    "a[class*='apply']",
+    ".apply-button",
+    "#apply-button",
+    "[data-testid*='apply']",
+    "button[title*='Apply']",
+    "a[title*='Apply']",
+    "button[data-automation-id='job-apply-button']",
+    ".btn-apply",
+    ".job-apply-button",
+    "button[data-track='apply']",
+    "a[data-track='apply']",
+    "button[data-qa='apply-button']",
+    "a[data-qa='apply-button']"
+)
+
+# Seconds to wait for a job page to show an apply button or form after loading
+PAGE_READY_TIMEOUT = 10
+
+# In continuous mode the browser is reused across cycles: restarted after this
+# many cycles to shed memory, and closed if the next cycle is this far away
+BROWSER_RECYCLE_CYCLES = 10
+BROWSER_IDLE_TIMEOUT = 3 * 60 * 60
+
+def _env_list(name: str) -> List[str]:
+    """Comma-separated environment variable as a list of trimmed, non-empty entries"""
+    return [item.strip() for item in os.getenv(name, '').split(',') if item.strip()]
+
 class EnhancedUltimateJobBot:
     """Enhanced Ultimate Job Bot with AI and advanced automation"""
     
@@ -807,6 +1215,7 @@ class EnhancedUltimateJobBot:
         # Initialize components
         self.config = self._load_configuration()
         self.user_profile = self._create_user_profile()
+        self._blacklist_lower = {company.lower() for company in self.user_profile.blacklisted_companies}
         self.db_manager = DatabaseManager()
         self.resume_parser = ResumeParser()
         self.relevance_scorer = JobRelevanceScorer()
@@ -814,10 +1223,16 @@ class EnhancedUltimateJobBot:
         self.notifications = NotificationSystem(self.config)
         self.job_scraper = EnhancedJobScraper(self.user_profile)
         
-        # Browser setup
+        # Browser setup; started on first use
         self.driver = None
+        self._keep_browser = False  # reuse the browser across cycles (continuous mode)
+        self._browser_cycles = 0
         self.applied_jobs = set()
         self.proof_folder = "application_proofs"
+        self._proof_prefix = os.path.join(self.proof_folder, "")
+        self._pending_applications = []  # database rows written once per cycle
+        self._applied_jobs_dirty = False  # history pickle written once per cycle
+        self._applications_log = None  # opened on first application
         
         # Create directories
         os.makedirs(self.proof_folder, exist_ok=True)
@@ -857,10 +1272,10 @@ class EnhancedUltimateJobBot:
                     }
                 },
                 'preferences': {
-                    'job_titles': os.getenv('JOB_TITLES', '').split(','),
-                    'skills': os.getenv('SKILLS', '').split(','),
-                    'blacklisted_companies': os.getenv('BLACKLISTED_COMPANIES', '').split(','),
-                    'preferred_companies': os.getenv('PREFERRED_COMPANIES', '').split(','),
+                    'job_titles': _env_list('JOB_TITLES'),
+                    'skills': _env_list('SKILLS'),
+                    'blacklisted_companies': _env_list('BLACKLISTED_COMPANIES'),
+                    'preferred_companies': _env_list('PREFERRED_COMPANIES'),
                     'salary_min': int(os.getenv('SALARY_MIN', '50000')),
                     'remote_only': os.getenv('REMOTE_ONLY', 'true').lower() == 'true',
                     'experience_level': os.getenv('EXPERIENCE_LEVEL', 'entry')
@@ -878,8 +1293,7 @@ class EnhancedUltimateJobBot:
         
         # Fallback to config file
         if not config and os.path.exists('user_config.json'):
-            with open('user_config.json', 'r') as f:
-                config = json.load(f)
+            config = _read_config_file('user_config.json', os.path.getmtime('user_config.json'))
         
         # Add default values
         if not config:
@@ -933,6 +1347,7 @@ class EnhancedUltimateJobBot:
             if os.path.exists("applied_jobs_history.pkl"):
                 with open("applied_jobs_history.pkl", 'rb') as f:
                     self.applied_jobs = pickle.load(f)
+            self.applied_jobs |= self.db_manager.load_applied_ids()
             logger.info(f"Loaded {len(self.applied_jobs)} applied jobs from history")
         except Exception as e:
             logger.error(f"Error loading applied jobs: {e}")
@@ -967,6 +1382,37 @@ class EnhancedUltimateJobBot:
     
     def setup_browser(self) -> bool:
         """Setup browser with Firefox/Chrome fallback for Windows compatibility"""
+        if self.driver is None:
+            self.driver = self._create_driver()
+            self._browser_cycles = 0
+        return self.driver is not None
+    
+    def _quit_browser(self):
+        """Close the browser if one is running"""
+        if self.driver:
+            try:
+                self.driver.quit()
+            except:
+                pass
+            self.driver = None
+    
+    def _release_browser(self):
+        """End-of-cycle browser handling: quit it, or clear it for the next cycle"""
+        if not self._keep_browser or self.driver is None:
+            self._quit_browser()
+            return
+        self._browser_cycles += 1
+        if self._browser_cycles >= BROWSER_RECYCLE_CYCLES:
+            self._quit_browser()
+            return
+        try:
+            self.driver.delete_all_cookies()
+        except Exception as e:
+            logger.warning(f"Browser unusable, restarting next cycle: {e}")
+            self._quit_browser()
+    
+    def _create_driver(self, scrape_only: bool = False):
+        """Start a new browser session, trying Firefox, then Chrome, then Edge"""
         # Try Firefox first
         try:
             from selenium.webdriver.firefox.options import Options as FirefoxOptions
@@ -978,8 +1424,8 @@ class EnhancedUltimateJobBot:
             options.add_argument("--width=1920")
             options.add_argument("--height=1080")
             
-            # Headless mode for CI/CD
-            if os.getenv('GITHUB_ACTIONS') == 'true':
+            # Headless mode for CI/CD and scraping-only sessions
+            if scrape_only or os.getenv('GITHUB_ACTIONS') == 'true':
                 options.add_argument("--headless")
             
             # Anti-detection measures
@@ -988,21 +1434,30 @@ class EnhancedUltimateJobBot:
             options.set_preference("general.useragent.override", 
                                  "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
             
+            # Turn off browser features the bot never uses
+            options.set_preference("dom.webnotifications.enabled", False)
+            options.set_preference("dom.ipc.plugins.enabled.libflashplayer.so", False)
+            options.set_preference("media.autoplay.default", 5)
+            if scrape_only:
+                # Sessions that only read listings never need images or a disk cache
+                options.set_preference("permissions.default.image", 2)
+                options.set_preference("browser.cache.disk.enable", False)
+            
             # Setup service
             if os.getenv('GITHUB_ACTIONS') == 'true':
                 service = FirefoxService('/usr/local/bin/geckodriver')
             else:
                 service = FirefoxService(GeckoDriverManager().install())
             
-            self.driver = webdriver.Firefox(service=service, options=options)
-            self.driver.set_page_load_timeout(30)
-            self.driver.implicitly_wait(10)
+            driver = webdriver.Firefox(service=service, options=options)
+            driver.set_page_load_timeout(30)
+            driver.implicitly_wait(10)
             
             # Execute anti-detection script
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
             logger.info("✅ Firefox browser setup completed successfully")
-            return True
+            return driver
             
         except Exception as firefox_error:
             logger.warning(f"Firefox setup failed: {firefox_error}")
@@ -1020,23 +1475,26 @@ class EnhancedUltimateJobBot:
                 options.add_argument("--window-size=1920,1080")
                 options.add_experimental_option("excludeSwitches", ["enable-automation"])
                 options.add_experimental_option('useAutomationExtension', False)
+                options.add_argument("--disable-notifications")
+                if scrape_only:
+                    options.add_argument("--blink-settings=imagesEnabled=false")
                 
-                # Headless mode for CI/CD
-                if os.getenv('GITHUB_ACTIONS') == 'true':
+                # Headless mode for CI/CD and scraping-only sessions
+                if scrape_only or os.getenv('GITHUB_ACTIONS') == 'true':
                     options.add_argument("--headless")
                 
                 # Setup service
                 service = ChromeService(ChromeDriverManager().install())
                 
-                self.driver = webdriver.Chrome(service=service, options=options)
-                self.driver.set_page_load_timeout(30)
-                self.driver.implicitly_wait(10)
+                driver = webdriver.Chrome(service=service, options=options)
+                driver.set_page_load_timeout(30)
+                driver.implicitly_wait(10)
                 
                 # Execute anti-detection script
-                self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+                driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
                 
                 logger.info("✅ Chrome browser setup completed successfully (Firefox fallback)")
-                return True
+                return driver
                 
             except Exception as chrome_error:
                 logger.error(f"Both Firefox and Chrome setup failed. Firefox: {firefox_error}, Chrome: {chrome_error}")
@@ -1056,16 +1514,61 @@ class EnhancedUltimateJobBot:
                         options.add_argument("--headless")
                     
                     service = EdgeService(EdgeChromiumDriverManager().install())
-                    self.driver = webdriver.Edge(service=service, options=options)
-                    self.driver.set_page_load_timeout(30)
-                    self.driver.implicitly_wait(10)
+                    driver = webdriver.Edge(service=service, options=options)
+                    driver.set_page_load_timeout(30)
+                    driver.implicitly_wait(10)
                     
                     logger.info("✅ Edge browser setup completed successfully (last resort)")
-                    return True
+                    return driver
                     
                 except Exception as edge_error:
                     logger.error(f"All browser setups failed. Firefox: {firefox_error}, Chrome: {chrome_error}, Edge: {edge_error}")
-                    return False
+                    return None
+    
+    def _search_browser_platforms(self) -> List[JobMatch]:
+        """Search the Selenium-based platforms, LinkedIn in its own browser alongside Dice"""
+        jobs = []
+        linkedin_enabled = bool(self.config.get('platforms', {}).get('linkedin', {}).get('email'))
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            linkedin_future = executor.submit(self._search_linkedin_in_own_browser) if linkedin_enabled else None
+            
+            # Dice.com; the main browser is only started if the page has to be rendered
+            try:
+                dice_jobs = self.job_scraper.search_dice(self._browser_or_none)
+                jobs.extend(dice_jobs)
+                logger.info(f"Found {len(dice_jobs)} Dice jobs")
+            except Exception as e:
+                logger.error(f"Dice search error: {e}")
+        
+        # LinkedIn (if credentials available)
+        if linkedin_future is not None:
+            try:
+                linkedin_jobs = linkedin_future.result()
+                if linkedin_jobs is None:
+                    # No second browser could be started, so share the main one
+                    linkedin_jobs = self.job_scraper.search_linkedin(self.driver) if self.setup_browser() else []
+                jobs.extend(linkedin_jobs)
+                logger.info(f"Found {len(linkedin_jobs)} LinkedIn jobs")
+            except Exception as e:
+                logger.error(f"LinkedIn search error: {e}")
+        return jobs
+    
+    def _browser_or_none(self):
+        """The main browser, started if needed, or None if it cannot be started"""
+        return self.driver if self.setup_browser() else None
+    
+    def _search_linkedin_in_own_browser(self) -> Optional[List[JobMatch]]:
+        """Search LinkedIn in a separate browser session, or None if one cannot be started"""
+        driver = self._create_driver(scrape_only=True)
+        if driver is None:
+            return None
+        try:
+            return self.job_scraper.search_linkedin(driver)
+        finally:
+            try:
+                driver.quit()
+            except Exception:
+                pass
     
     def search_all_jobs(self) -> List[JobMatch]:
         """Search jobs from all platforms"""
@@ -1073,63 +1576,52 @@ class EnhancedUltimateJobBot:
         
         logger.info("🔍 Searching all platforms for jobs...")
         
-        # RemoteOK (API-based, no browser needed)
+        # RemoteOK is API-based, so fetch it in the background while the browser searches run
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            remoteok_future = executor.submit(self.job_scraper.search_remoteok)
+            browser_jobs = self._search_browser_platforms()
+        
         try:
-            remoteok_jobs = self.job_scraper.search_remoteok()
+            remoteok_jobs = remoteok_future.result()
             all_jobs.extend(remoteok_jobs)
             logger.info(f"Found {len(remoteok_jobs)} RemoteOK jobs")
         except Exception as e:
             logger.error(f"RemoteOK search error: {e}")
+        all_jobs.extend(browser_jobs)
         
-        # Browser-based searches
-        if self.driver:
-            # Dice.com
+        # Jobs already applied to are never applied to again, so don't score them
+        found = len(all_jobs)
+        all_jobs = [job for job in all_jobs if job.id not in self.applied_jobs]
+        if found > len(all_jobs):
+            logger.info(f"⏭️ Skipping {found - len(all_jobs)} jobs already applied to")
+        
+        # Calculate relevance scores using both basic and advanced scoring
+        self.relevance_scorer.score_batch(self.user_profile, all_jobs)
+        
+        # The advanced scorer depends only on the profile, so build it once per search
+        advanced_scorer = None
+        if ADVANCED_SCORING_AVAILABLE and all_jobs:
             try:
-                dice_jobs = self.job_scraper.search_dice(self.driver)
-                all_jobs.extend(dice_jobs)
-                logger.info(f"Found {len(dice_jobs)} Dice jobs")
+                user_profile_dict = {
+                    'skills': self.user_profile.skills,
+                    'experience_years': self.user_profile.experience_years,
+                    'preferred_roles': self.user_profile.preferred_roles,
+                    'location': self.user_profile.location,
+                    'remote_only': self.user_profile.remote_only,
+                    'salary_min': self.user_profile.salary_min,
+                    'preferred_companies': self.user_profile.preferred_companies,
+                    'blacklisted_companies': self.user_profile.blacklisted_companies,
+                    'keywords': self.user_profile.skills,  # Use skills as keywords
+                    'bio': f"Experienced professional in {', '.join(self.user_profile.preferred_roles[:3])}"
+                }
+                advanced_scorer = AdvancedJobScorer(user_profile_dict)
             except Exception as e:
-                logger.error(f"Dice search error: {e}")
-            
-            # LinkedIn (if credentials available)
-            if self.config.get('platforms', {}).get('linkedin', {}).get('email'):
-                try:
-                    linkedin_jobs = self.job_scraper.search_linkedin(self.driver)
-                    all_jobs.extend(linkedin_jobs)
-                    logger.info(f"Found {len(linkedin_jobs)} LinkedIn jobs")
-                except Exception as e:
-                    logger.error(f"LinkedIn search error: {e}")
+                logger.error(f"Advanced scorer initialization error: {e}")
         
-        # Calculate relevance scores using both basic and advanced scoring
         for job in all_jobs:
-            # Basic relevance scoring
-            job.relevance_score = self.relevance_scorer.calculate_relevance_score(
-                self.user_profile, job
-            )
-            job.sentiment_score = self.relevance_scorer.analyze_job_sentiment(
-                job.description
-            )
-            job.skill_match_percentage = self.relevance_scorer.calculate_skill_match(
-                self.user_profile.skills, job.requirements
-            )
-            
             # Enhanced scoring with advanced system if available
-            if ADVANCED_SCORING_AVAILABLE:
+            if advanced_scorer is not None:
                 try:
-                    # Create user profile for advanced scorer
-                    user_profile_dict = {
-                        'skills': self.user_profile.skills,
-                        'experience_years': self.user_profile.experience_years,
-                        'preferred_roles': self.user_profile.preferred_roles,
-                        'location': self.user_profile.location,
-                        'remote_only': self.user_profile.remote_only,
-                        'salary_min': self.user_profile.salary_min,
-                        'preferred_companies': self.user_profile.preferred_companies,
-                        'blacklisted_companies': self.user_profile.blacklisted_companies,
-                        'keywords': self.user_profile.skills,  # Use skills as keywords
-                        'bio': f"Experienced professional in {', '.join(self.user_profile.preferred_roles[:3])}"
-                    }
-                    
                     # Create job data for advanced scorer
                     job_data = {
                         'title': job.title,
@@ -1141,7 +1633,6 @@ class EnhancedUltimateJobBot:
                     }
                     
                     # Get advanced scoring
-                    advanced_scorer = AdvancedJobScorer(user_profile_dict)
                     advanced_metrics = advanced_scorer.score_job(job_data)
                     
                     # Use advanced score if it's higher or more comprehensive
@@ -1173,34 +1664,11 @@ class EnhancedUltimateJobBot:
     
     def generate_cover_letter(self, job_match: JobMatch) -> str:
         """Generate personalized cover letter"""
-        template = """Dear Hiring Manager,
-
-I am writing to express my strong interest in the {job_title} position at {company_name}. With my background in {key_skills} and {experience_years} years of experience in the field, I am excited about the opportunity to contribute to your team's success.
-
-My technical expertise includes:
-{skills_list}
-
-What particularly attracts me to {company_name} is your commitment to innovation and technical excellence. I believe my skills in {relevant_skills} align perfectly with your requirements and would enable me to make meaningful contributions to your projects.
-
-I am especially interested in this role because:
-- The position matches my career goals in {preferred_role}
-- Your company's reputation for {company_strength}
-- The opportunity to work with cutting-edge technologies
-
-I would welcome the opportunity to discuss how my experience and passion for technology can contribute to {company_name}'s continued success. Thank you for considering my application.
-
-Best regards,
-{full_name}
-Email: {email}
-Phone: {phone}
-LinkedIn: {linkedin}
-"""
         
         # Extract key skills relevant to the job
-        relevant_skills = []
-        for skill in self.user_profile.skills[:5]:
-            if skill.lower() in job_match.requirements.lower():
-                relevant_skills.append(skill)
+        requirements_lower = job_match.requirements.lower()
+        relevant_skills = [skill for skill in self.user_profile.skills[:5]
+                           if skill.lower() in requirements_lower]
         
         if not relevant_skills:
             relevant_skills = self.user_profile.skills[:3]
@@ -1209,33 +1677,25 @@ LinkedIn: {linkedin}
         skills_list = "\n".join([f"• {skill}" for skill in self.user_profile.skills[:8]])
         
         # Determine company strength
-        company_strengths = {
-            'google': 'innovation and global impact',
-            'microsoft': 'enterprise solutions and cloud technology',
-            'amazon': 'scale and customer obsession',
-            'meta': 'social connectivity and VR innovation',
-            'apple': 'design excellence and user experience'
-        }
-        
-        company_strength = company_strengths.get(
+        company_strength = _COMPANY_STRENGTHS.get(
             job_match.company.lower().split()[0],
             'technical excellence and innovation'
         )
         
-        cover_letter = template.format(
-            job_title=job_match.title,
-            company_name=job_match.company,
-            key_skills=", ".join(relevant_skills[:3]),
-            experience_years=max(1, self.user_profile.experience_years),
-            skills_list=skills_list,
-            relevant_skills=", ".join(relevant_skills[:2]),
-            preferred_role=self.user_profile.preferred_roles[0] if self.user_profile.preferred_roles else "software development",
-            company_strength=company_strength,
-            full_name=self.user_profile.name,
-            email=self.user_profile.email,
-            phone=self.user_profile.phone,
-            linkedin=self.config.get('personal', {}).get('linkedin', '')
-        )
+        cover_letter = _COVER_LETTER_TEMPLATE.format_map({
+            'job_title': job_match.title,
+            'company_name': job_match.company,
+            'key_skills': ", ".join(relevant_skills[:3]),
+            'experience_years': max(1, self.user_profile.experience_years),
+            'skills_list': skills_list,
+            'relevant_skills': ", ".join(relevant_skills[:2]),
+            'preferred_role': self.user_profile.preferred_roles[0] if self.user_profile.preferred_roles else "software development",
+            'company_strength': company_strength,
+            'full_name': self.user_profile.name,
+            'email': self.user_profile.email,
+            'phone': self.user_profile.phone,
+            'linkedin': self.config.get('personal', {}).get('linkedin', '')
+        })
         
         return cover_letter
     
@@ -1243,19 +1703,20 @@ LinkedIn: {linkedin}
         """Take proof screenshot"""
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_title = "".join(c for c in job_match.title if c.isalnum() or c in (' ', '-', '_'))[:50]
-            safe_company = "".join(c for c in job_match.company if c.isalnum() or c in (' ', '-', '_'))[:30]
+            safe_title = job_match.title.translate(_FILENAME_CHARS)[:50]
+            safe_company = job_match.company.translate(_FILENAME_CHARS)[:30]
             
-            filename = f"{self.proof_folder}/{job_match.platform}_{safe_company}_{safe_title}"
+            basename = f"{job_match.platform}_{safe_company}_{safe_title}"
             if suffix:
-                filename += f"_{suffix}"
-            filename += f"_{timestamp}.png"
+                basename += f"_{suffix}"
+            basename += f"_{timestamp}.png"
             
-            # Clean filename
-            filename = filename.replace(" ", "_").replace("/", "_").replace("\\", "_")[:200]
+            # Clean filename; only the file name, so the screenshot lands inside proof_folder
+            basename = basename.translate(_FILENAME_SEPARATORS)[:200 - len(self._proof_prefix)]
+            filename = self._proof_prefix + basename
             
             self.driver.save_screenshot(filename)
-            logger.info(f"📸 Screenshot saved: {os.path.basename(filename)}")
+            logger.info(f"📸 Screenshot saved: {basename}")
             
             return filename
             
@@ -1263,19 +1724,29 @@ LinkedIn: {linkedin}
             logger.error(f"Screenshot error: {e}")
             return ""
     
+    def _should_skip(self, job_match: JobMatch) -> Optional[str]:
+        """Reason not to apply to a job, or None if it should be applied to"""
+        if job_match.id in self.applied_jobs:
+            return "Already applied to this job"
+        if job_match.company.lower() in self._blacklist_lower:
+            return f"{job_match.company} is blacklisted"
+        return None
+    
     def apply_to_job(self, job_match: JobMatch) -> bool:
         """Apply to job with enhanced automation and captcha handling"""
         try:
             logger.info(f"📝 Applying to: {job_match.title} at {job_match.company}")
             
-            # Check if already applied
-            if job_match.id in self.applied_jobs:
-                logger.info("Already applied to this job, skipping...")
+            # Cheap checks before any browser or cover letter work
+            skip_reason = self._should_skip(job_match)
+            if skip_reason:
+                logger.info(f"{skip_reason}, skipping...")
                 return False
             
             # Mark as applied to prevent duplicates
             self.applied_jobs.add(job_match.id)
-            self._save_applied_jobs()
+            self.db_manager.record_applied_id(job_match.id)
+            self._applied_jobs_dirty = True
             
             # Generate cover letter
             cover_letter = self.generate_cover_letter(job_match)
@@ -1284,7 +1755,7 @@ LinkedIn: {linkedin}
             if self.driver and job_match.url:
                 try:
                     self.driver.get(job_match.url)
-                    time.sleep(self.scheduler.get_random_delay())
+                    self._wait_for_job_page()
                     
                     # Initialize captcha solver if available
                     if CAPTCHA_SOLVER_AVAILABLE:
@@ -1331,8 +1802,10 @@ LinkedIn: {linkedin}
             else:
                 screenshot_path = ""
             
-            # Save to database
-            self.db_manager.save_application(job_match, screenshot_path, cover_letter)
+            # Queue for the database; rows are saved in one transaction per cycle
+            self._pending_applications.append(
+                self.db_manager.application_row(job_match, screenshot_path, cover_letter)
+            )
             
             # Log application
             self._log_application(job_match, screenshot_path)
@@ -1350,40 +1823,31 @@ LinkedIn: {linkedin}
             self.notifications.notify_error(str(e), f"Applying to {job_match.title}")
             return False
     
+    def _wait_for_job_page(self):
+        """Wait until the job page shows an apply button or a form, then pause briefly"""
+        try:
+            WebDriverWait(self.driver, PAGE_READY_TIMEOUT).until(
+                lambda driver: self._query_selectors(_APPLY_BUTTON_SELECTORS + ('form',))
+            )
+        except TimeoutException:
+            pass
+        # Short human-like pause; pacing between applications happens in the cycle loop
+        time.sleep(random.uniform(0.2, 0.8))
+    
+    def _query_selectors(self, selectors, usable_only: bool = False) -> List[Tuple[str, object]]:
+        """(selector, element) for every match of each selector, in selector order"""
+        try:
+            pairs = self.driver.execute_script(_QUERY_SELECTORS_JS, list(selectors), usable_only)
+            return [tuple(pair) for pair in pairs or []]
+        except Exception as e:
+            logger.error(f"Selector query error: {e}")
+            return []
+    
     def _find_apply_button(self):
         """Find apply button with multiple selectors"""
-        selectors = [
-            # Common apply button selectors
-            "button[data-control-name='jobdetails_topcard_inapply']",  # LinkedIn
-            "button[aria-label='Apply']",
-            "a[data-cy='apply-button']",  # Dice
-            "button:contains('Apply')",
-            "a:contains('Apply')",
-            "input[value*='Apply']",
-            "button[class*='apply']",
-            "a[class*='apply']",
-            ".apply-button",
-            "#apply-button",
-            "[data-testid*='apply']",
-            "button[title*='Apply']",
-            "a[title*='Apply']",
-            "button[data-automation-id='job-apply-button']",
-            ".btn-apply",
-            ".job-apply-button",
-            "button[data-track='apply']",
-            "a[data-track='apply']",
-            "button[data-qa='apply-button']",
-            "a[data-qa='apply-button']"
-        ]
-        
-        for selector in selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    if element.is_displayed() and element.is_enabled():
-                        return element
-            except:
-                continue
+        # Visibility and enabled state are filtered in the same script call
+        for _, element in self._query_selectors(_APPLY_BUTTON_SELECTORS, usable_only=True):
+            return element
         
         return None
     
@@ -1416,14 +1880,9 @@ LinkedIn: {linkedin}
                 'textarea[name*="why"]': f"I am interested in this {job_match.title} position because it aligns with my skills in {', '.join(self.user_profile.skills[:3])}."
             }
             
-            for selector, value in form_fields.items():
+            for selector, element in self._query_selectors(form_fields, usable_only=True):
                 try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            element.clear()
-                            element.send_keys(value)
-                            time.sleep(0.5)
+                    self._fill_field(element, form_fields[selector])
                 except:
                     continue
             
@@ -1436,18 +1895,22 @@ LinkedIn: {linkedin}
                 ".submit-button"
             ]
             
-            for selector in submit_selectors:
+            for _, submit_btn in self._query_selectors(submit_selectors, usable_only=True):
                 try:
-                    submit_btn = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if submit_btn.is_displayed() and submit_btn.is_enabled():
-                        submit_btn.click()
-                        break
+                    submit_btn.click()
+                    break
                 except:
                     continue
                     
         except Exception as e:
             logger.error(f"Form filling error: {e}")
     
+    def _fill_field(self, element, value: str):
+        """Set a form field in one script call, typing it only if the page rejects that"""
+        if not self.driver.execute_script(_FILL_FIELD_JS, element, value):
+            element.clear()
+            element.send_keys(value)
+    
     def _basic_captcha_check(self):
         """Basic captcha detection and handling"""
         try:
@@ -1460,16 +1923,11 @@ LinkedIn: {linkedin}
                 "#captcha"
             ]
             
-            for selector in captcha_selectors:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if element.is_displayed():
-                        logger.warning(f"⚠️ Basic captcha detected: {selector}")
-                        # Wait a bit for potential auto-resolution
-                        time.sleep(5)
-                        return
-                except:
-                    continue
+            for selector, _ in self._query_selectors(captcha_selectors, usable_only=True):
+                logger.warning(f"⚠️ Basic captcha detected: {selector}")
+                # Wait a bit for potential auto-resolution
+                time.sleep(5)
+                return
                     
         except Exception as e:
             logger.error(f"Basic captcha check error: {e}")
@@ -1480,11 +1938,25 @@ LinkedIn: {linkedin}
         log_entry = f"{timestamp} - Applied to {job_match.title} at {job_match.company} ({job_match.platform}) - Score: {job_match.relevance_score:.1f}% - URL: {job_match.url} - Proof: {screenshot_path}\n"
         
         try:
-            with open("enhanced_applications.txt", 'a', encoding='utf-8') as f:
-                f.write(log_entry)
+            self._write_application_log(log_entry)
         except Exception as e:
             logger.error(f"Logging error: {e}")
     
+    def _write_application_log(self, entry: str):
+        """Append to the applications file through one buffered handle per cycle"""
+        if self._applications_log is None:
+            self._applications_log = open("enhanced_applications.txt", 'a', encoding='utf-8', buffering=1 << 16)
+        self._applications_log.write(entry)
+    
+    def _close_application_log(self):
+        """Flush and close the applications file"""
+        if self._applications_log is not None:
+            try:
+                self._applications_log.close()
+            except Exception as e:
+                logger.error(f"Logging error: {e}")
+            self._applications_log = None
+    
     def run_application_cycle(self) -> Dict:
         """Run complete application cycle"""
         logger.info("🚀 Starting Enhanced Job Application Cycle")
@@ -1499,12 +1971,7 @@ LinkedIn: {linkedin}
         }
         
         try:
-            # Setup browser
-            if not self.setup_browser():
-                logger.error("Failed to setup browser")
-                return stats
-            
-            # Search all jobs
+            # Search all jobs; the browser starts only when a platform or application needs it
             jobs = self.search_all_jobs()
             stats['jobs_found'] = len(jobs)
             stats['platforms_searched'] = len(set(job.platform for job in jobs))
@@ -1531,6 +1998,15 @@ LinkedIn: {linkedin}
                     logger.info("Rate limit reached, stopping applications")
                     break
                 
+                skip_reason = self._should_skip(job)
+                if skip_reason:
+                    logger.info(f"⏭️ {skip_reason}: {job.title} at {job.company}")
+                    continue
+                
+                if not self.setup_browser():
+                    logger.error("Failed to setup browser")
+                    break
+                
                 try:
                     # Send notification for high-scoring jobs
                     if job.relevance_score >= 80:
@@ -1581,17 +2057,25 @@ Duration: {duration:.1f} minutes
             stats['errors'] += 1
             
         finally:
-            if self.driver:
-                try:
-                    self.driver.quit()
-                except:
-                    pass
+            self._flush_applications()
+            self._close_application_log()
+            if self._applied_jobs_dirty:
+                # The shared history file is rewritten once per cycle; the database has every ID already
+                self._save_applied_jobs()
+                self._applied_jobs_dirty = False
+            self._release_browser()
         
         return stats
     
+    def _flush_applications(self):
+        """Write queued application rows to the database"""
+        rows, self._pending_applications = self._pending_applications, []
+        self.db_manager.save_applications_bulk(rows)
+    
     def run_continuous(self):
         """Run bot continuously with smart scheduling"""
         logger.info("🔄 Starting continuous job bot operation...")
+        self._keep_browser = True
         
         while True:
             try:
@@ -1603,12 +2087,15 @@ Duration: {duration:.1f} minutes
                 wait_minutes = (next_run - datetime.now()).total_seconds() / 60
                 
                 logger.info(f"⏰ Next run scheduled for: {next_run.strftime('%Y-%m-%d %H:%M:%S')} (in {wait_minutes:.1f} minutes)")
+                if wait_minutes * 60 > BROWSER_IDLE_TIMEOUT:
+                    self._quit_browser()
                 
                 # Wait until next run
                 time.sleep(wait_minutes * 60)
                 
             except KeyboardInterrupt:
                 logger.info("🛑 Bot stopped by user")
+                self._quit_browser()
                 break
             except Exception as e:
                 logger.error(f"Continuous run error: {e}")